@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -40,6 +41,10 @@ def register_deleter(resource_type: str, fn: Callable[[str], None]) -> None:
 MANIFEST_FILENAME = ".databricks-resources.json"
 MANIFEST_VERSION = 1
 
+# Serializes read-modify-write cycles on the manifest; tools run in worker
+# threads, so concurrent creates/deletes would otherwise drop each other's entries.
+_manifest_lock = threading.Lock()
+
 
 def _get_manifest_path() -> Path:
     """Get the path to the manifest file.
@@ -109,43 +114,44 @@ def track_resource(
     This is best-effort: failures are logged but never raised.
     """
     try:
-        data = _read_manifest()
-        resources: List[Dict[str, Any]] = data.get("resources", [])
-        now = _now_iso()
-
-        # Try to find by type+id
-        for r in resources:
-            if r.get("type") == resource_type and r.get("id") == resource_id:
-                r["name"] = name
-                if url:
-                    r["url"] = url
-                r["updated_at"] = now
-                _write_manifest(data)
-                return
-
-        # Try to find by type+name (handles ID changes across sessions)
-        for r in resources:
-            if r.get("type") == resource_type and r.get("name") == name:
-                r["id"] = resource_id
-                if url:
-                    r["url"] = url
-                r["updated_at"] = now
-                _write_manifest(data)
-                return
-
-        # New resource
-        entry: Dict[str, Any] = {
-            "type": resource_type,
-            "name": name,
-            "id": resource_id,
-            "created_at": now,
-            "updated_at": now,
-        }
-        if url:
-            entry["url"] = url
-        resources.append(entry)
-        data["resources"] = resources
-        _write_manifest(data)
+        with _manifest_lock:
+            data = _read_manifest()
+            resources: List[Dict[str, Any]] = data.get("resources", [])
+            now = _now_iso()
+
+            # Try to find by type+id
+            for r in resources:
+                if r.get("type") == resource_type and r.get("id") == resource_id:
+                    r["name"] = name
+                    if url:
+                        r["url"] = url
+                    r["updated_at"] = now
+                    _write_manifest(data)
+                    return
+
+            # Try to find by type+name (handles ID changes across sessions)
+            for r in resources:
+                if r.get("type") == resource_type and r.get("name") == name:
+                    r["id"] = resource_id
+                    if url:
+                        r["url"] = url
+                    r["updated_at"] = now
+                    _write_manifest(data)
+                    return
+
+            # New resource
+            entry: Dict[str, Any] = {
+                "type": resource_type,
+                "name": name,
+                "id": resource_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            if url:
+                entry["url"] = url
+            resources.append(entry)
+            data["resources"] = resources
+            _write_manifest(data)
     except Exception as exc:
         logger.warning("Failed to track resource %s/%s: %s", resource_type, name, exc)
 
@@ -156,16 +162,17 @@ def remove_resource(resource_type: str, resource_id: str) -> bool:
     Returns True if the resource was found and removed.
     """
     try:
-        data = _read_manifest()
-        resources = data.get("resources", [])
-        original_count = len(resources)
-        data["resources"] = [
-            r for r in resources if not (r.get("type") == resource_type and r.get("id") == resource_id)
-        ]
-        if len(data["resources"]) < original_count:
-            _write_manifest(data)
-            return True
-        return False
+        with _manifest_lock:
+            data = _read_manifest()
+            resources = data.get("resources", [])
+            original_count = len(resources)
+            data["resources"] = [
+                r for r in resources if not (r.get("type") == resource_type and r.get("id") == resource_id)
+            ]
+            if len(data["resources"]) < original_count:
+                _write_manifest(data)
+                return True
+            return False
     except Exception as exc:
         logger.warning("Failed to remove resource %s/%s: %s", resource_type, resource_id, exc)
         return False
@@ -64,7 +64,14 @@ def _patch_tool_decorator_for_windows():
 
 
 def _wrap_sync_in_thread(fn):
-    """Wrap a sync function to run in asyncio.to_thread(), preserving metadata."""
+    """Wrap a sync function to run in asyncio.to_thread(), preserving metadata.
+
+    Also applied explicitly to tools that block on slow Databricks calls, so
+    they don't stall the event loop for other tool calls. Such tools may then
+    run concurrently, so any shared state they touch (e.g. the resource
+    manifest) must be thread-safe. Context variables, including per-request
+    auth, are carried into the worker thread.
+    """
 
     @functools.wraps(fn)
     async def async_wrapper(**kwargs):
@@ -12,10 +12,28 @@ from databricks_tools_core.compute import (
     NoRunningClusterError,
 )
 
-from ..server import mcp
+from ..server import mcp, _wrap_sync_in_thread
+
+
+def _no_running_cluster_response(e: NoRunningClusterError) -> Dict[str, Any]:
+    """Build the execution-shaped error response for a NoRunningClusterError."""
+    return {
+        "success": False,
+        "output": None,
+        "error": str(e),
+        "cluster_id": None,
+        "context_id": None,
+        "context_destroyed": True,
+        "message": None,
+        "suggestions": e.suggestions,
+        "startable_clusters": e.startable_clusters,
+        "skipped_clusters": e.skipped_clusters,
+        "available_clusters": e.available_clusters,
+    }
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def list_clusters() -> List[Dict[str, Any]]:
     """
     List all clusters in the workspace.
@@ -27,6 +45,7 @@ def list_clusters() -> List[Dict[str, Any]]:
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def get_best_cluster() -> Dict[str, Any]:
     """
     Get the ID of the best available cluster for code execution.
@@ -45,6 +64,7 @@ def get_best_cluster() -> Dict[str, Any]:
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def start_cluster(cluster_id: str) -> Dict[str, Any]:
     """
     Start a terminated Databricks cluster.
@@ -77,6 +97,7 @@ def start_cluster(cluster_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def get_cluster_status(cluster_id: str) -> Dict[str, Any]:
     """
     Get the current status of a Databricks cluster.
@@ -98,6 +119,7 @@ def get_cluster_status(cluster_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def execute_databricks_command(
     code: str,
     cluster_id: str = None,
@@ -109,8 +131,10 @@ def execute_databricks_command(
     """
     Execute code on a Databricks cluster.
 
-    If context_id is provided, reuses the existing context (faster, maintains state).
-    If not provided, creates a new context.
+    If context_id is provided, reuses the existing context (faster, maintains state)
+    and keeps it private to you. If not provided, reuses an idle context left by a
+    recent call on the same cluster (and language) without a context_id, or creates
+    a new context; that context stays in a shared pool until you pass it back.
 
     By default, the context is kept alive for reuse. Set destroy_context_on_completion=True
     to destroy it after execution.
@@ -140,7 +164,7 @@ def execute_databricks_command(
         - output: The output from execution
         - error: Error message if failed
         - cluster_id: The cluster ID used
-        - context_id: The context ID (reuse this for follow-up commands!)
+        - context_id: The context ID (pass it back to keep state for follow-up commands)
         - context_destroyed: Whether the context was destroyed
         - message: Helpful message about reusing the context
 
@@ -166,22 +190,11 @@ def execute_databricks_command(
         )
         return result.to_dict()
     except NoRunningClusterError as e:
-        return {
-            "success": False,
-            "output": None,
-            "error": str(e),
-            "cluster_id": None,
-            "context_id": None,
-            "context_destroyed": True,
-            "message": None,
-            "suggestions": e.suggestions,
-            "startable_clusters": e.startable_clusters,
-            "skipped_clusters": e.skipped_clusters,
-            "available_clusters": e.available_clusters,
-        }
+        return _no_running_cluster_response(e)
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def run_python_file_on_databricks(
     file_path: str,
     cluster_id: str = None,
@@ -194,8 +207,10 @@ def run_python_file_on_databricks(
 
     Useful for running data generation scripts or other Python code.
 
-    If context_id is provided, reuses the existing context (faster, maintains state).
-    If not provided, creates a new context.
+    If context_id is provided, reuses the existing context (faster, maintains state)
+    and keeps it private to you. If not provided, reuses an idle context left by a
+    recent call on the same cluster (and language) without a context_id, or creates
+    a new context; that context stays in a shared pool until you pass it back.
 
     If no cluster_id is provided and no accessible running cluster is found,
     returns an error with actionable suggestions (startable clusters, alternatives).
@@ -217,7 +232,7 @@ def run_python_file_on_databricks(
         - output: The output from execution
         - error: Error message if failed
         - cluster_id: The cluster ID used
-        - context_id: The context ID (reuse this for follow-up commands!)
+        - context_id: The context ID (pass it back to keep state for follow-up commands)
         - context_destroyed: Whether the context was destroyed
         - message: Helpful message about reusing the context
     """
@@ -237,16 +252,4 @@ def run_python_file_on_databricks(
         )
         return result.to_dict()
     except NoRunningClusterError as e:
-        return {
-            "success": False,
-            "output": None,
-            "error": str(e),
-            "cluster_id": None,
-            "context_id": None,
-            "context_destroyed": True,
-            "message": None,
-            "suggestions": e.suggestions,
-            "startable_clusters": e.startable_clusters,
-            "skipped_clusters": e.skipped_clusters,
-            "available_clusters": e.available_clusters,
-        }
+        return _no_running_cluster_response(e)
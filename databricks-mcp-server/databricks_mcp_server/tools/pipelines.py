@@ -6,18 +6,22 @@ from databricks_tools_core.identity import get_default_tags
 from databricks_tools_core.spark_declarative_pipelines.pipelines import (
     create_pipeline as _create_pipeline,
     get_pipeline as _get_pipeline,
+    get_pipelines as _get_pipelines,
     update_pipeline as _update_pipeline,
     delete_pipeline as _delete_pipeline,
+    delete_pipelines as _delete_pipelines,
     start_update as _start_update,
+    find_running_validation as _find_running_validation,
     get_update as _get_update,
+    wait_for_update_change as _wait_for_update_change,
     stop_pipeline as _stop_pipeline,
-    get_pipeline_events as _get_pipeline_events,
+    iter_pipeline_events as _iter_pipeline_events,
     create_or_update_pipeline as _create_or_update_pipeline,
     find_pipeline_by_name as _find_pipeline_by_name,
 )
 
 from ..manifest import register_deleter
-from ..server import mcp
+from ..server import mcp, _wrap_sync_in_thread
 
 
 def _delete_pipeline_resource(resource_id: str) -> None:
@@ -27,7 +31,43 @@ def _delete_pipeline_resource(resource_id: str) -> None:
 register_deleter("pipeline", _delete_pipeline_resource)
 
 
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert SDK objects to serializable dicts."""
+    return obj.as_dict() if hasattr(obj, "as_dict") else vars(obj)
+
+
+def _with_default_tags(extra_settings: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Inject default tags into extra_settings; user tags take precedence."""
+    extra_settings = extra_settings or {}
+    extra_settings.setdefault("tags", {})
+    extra_settings["tags"] = {**get_default_tags(), **extra_settings["tags"]}
+    return extra_settings
+
+
+def _track_pipeline(name: str, pipeline_id: str) -> None:
+    """Record a created/updated pipeline in the manifest (best-effort)."""
+    if not pipeline_id:
+        return
+    try:
+        from ..manifest import track_resource
+
+        track_resource(resource_type="pipeline", name=name, resource_id=pipeline_id)
+    except Exception:
+        pass  # best-effort tracking
+
+
+def _untrack_pipeline(pipeline_id: str) -> None:
+    """Remove a deleted pipeline from the manifest (best-effort)."""
+    try:
+        from ..manifest import remove_resource
+
+        remove_resource(resource_type="pipeline", resource_id=pipeline_id)
+    except Exception:
+        pass
+
+
 @mcp.tool
+@_wrap_sync_in_thread
 def create_pipeline(
     name: str,
     root_path: str,
@@ -52,10 +92,7 @@ def create_pipeline(
     Returns:
         Dictionary with pipeline_id of the created pipeline.
     """
-    # Auto-inject default tags into extra_settings; user tags take precedence
-    extra_settings = extra_settings or {}
-    extra_settings.setdefault("tags", {})
-    extra_settings["tags"] = {**get_default_tags(), **extra_settings["tags"]}
+    extra_settings = _with_default_tags(extra_settings)
 
     result = _create_pipeline(
         name=name,
@@ -66,23 +103,12 @@ def create_pipeline(
         extra_settings=extra_settings,
     )
 
-    # Track resource on successful create
-    try:
-        if result.pipeline_id:
-            from ..manifest import track_resource
-
-            track_resource(
-                resource_type="pipeline",
-                name=name,
-                resource_id=result.pipeline_id,
-            )
-    except Exception:
-        pass  # best-effort tracking
-
+    _track_pipeline(name, result.pipeline_id)
     return {"pipeline_id": result.pipeline_id}
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def get_pipeline(pipeline_id: str) -> Dict[str, Any]:
     """
     Get pipeline details and configuration.
@@ -94,10 +120,35 @@ def get_pipeline(pipeline_id: str) -> Dict[str, Any]:
         Dictionary with pipeline configuration and state.
     """
     result = _get_pipeline(pipeline_id=pipeline_id)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 @mcp.tool
+@_wrap_sync_in_thread
+def get_pipelines(pipeline_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get details for several pipelines in one call (fetched concurrently).
+
+    Prefer this over repeated get_pipeline calls when inspecting many pipelines.
+
+    Args:
+        pipeline_ids: List of pipeline IDs
+
+    Returns:
+        List (in input order) of dictionaries with pipeline_id, success, and
+        either pipeline (configuration and state) or error.
+    """
+    results = []
+    for r in _get_pipelines(pipeline_ids=pipeline_ids):
+        if r.success:
+            results.append({"pipeline_id": r.key, "success": True, "pipeline": _to_dict(r.result)})
+        else:
+            results.append({"pipeline_id": r.key, "success": False, "error": r.error})
+    return results
+
+
+@mcp.tool
+@_wrap_sync_in_thread
 def update_pipeline(
     pipeline_id: str,
     name: str = None,
@@ -116,7 +167,8 @@ def update_pipeline(
         root_path: New root folder for source code
         catalog: New catalog name
         schema: New schema name
-        workspace_file_paths: New list of file paths (raw .sql or .py files)
+        workspace_file_paths: New list of file paths (raw .sql or .py files).
+            Omit (or pass an empty list) to keep the current libraries.
         extra_settings: Optional dict with additional pipeline settings (clusters,
             continuous, development, photon, edition, channel, event_log, configuration,
             notifications, tags, serverless, etc.). Explicit parameters take precedence.
@@ -124,6 +176,14 @@ def update_pipeline(
     Returns:
         Dictionary with status message.
     """
+    # Convert empty strings to None (Claude agent sometimes passes "" instead of null)
+    name = name or None
+    root_path = root_path or None
+    catalog = catalog or None
+    schema = schema or None
+    # An empty list would clear every source library, so treat it as "unchanged" too
+    workspace_file_paths = workspace_file_paths or None
+
     _update_pipeline(
         pipeline_id=pipeline_id,
         name=name,
@@ -137,6 +197,7 @@ def update_pipeline(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def delete_pipeline(pipeline_id: str) -> Dict[str, str]:
     """
     Delete a pipeline.
@@ -148,26 +209,52 @@ def delete_pipeline(pipeline_id: str) -> Dict[str, str]:
         Dictionary with status message.
     """
     _delete_pipeline(pipeline_id=pipeline_id)
-    try:
-        from ..manifest import remove_resource
-
-        remove_resource(resource_type="pipeline", resource_id=pipeline_id)
-    except Exception:
-        pass
+    _untrack_pipeline(pipeline_id)
     return {"status": "deleted"}
 
 
 @mcp.tool
+@_wrap_sync_in_thread
+def delete_pipelines(pipeline_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Delete several pipelines in one call (deleted concurrently).
+
+    A failure to delete one pipeline does not stop the others.
+
+    Args:
+        pipeline_ids: List of pipeline IDs
+
+    Returns:
+        List (in input order) of dictionaries with pipeline_id, status
+        ("deleted" or "failed"), and error when deletion failed.
+    """
+    results = []
+    for r in _delete_pipelines(pipeline_ids=pipeline_ids):
+        if not r.success:
+            results.append({"pipeline_id": r.key, "status": "failed", "error": r.error})
+            continue
+        _untrack_pipeline(r.key)
+        results.append({"pipeline_id": r.key, "status": "deleted"})
+    return results
+
+
+@mcp.tool
+@_wrap_sync_in_thread
 def start_update(
     pipeline_id: str,
     refresh_selection: List[str] = None,
     full_refresh: bool = False,
     full_refresh_selection: List[str] = None,
     validate_only: bool = False,
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """
     Start a pipeline update or dry-run validation.
 
+    If an identical dry run started moments ago is still running, its update_id
+    is returned instead of queuing another one, with reused_running_validation=True.
+    That dry run validates the source as it was when it started; if you changed
+    pipeline files since, wait for it to finish and call again.
+
     Args:
         pipeline_id: Pipeline ID
         refresh_selection: List of table names to refresh
@@ -176,19 +263,34 @@ def start_update(
         validate_only: If True, validates without updating data (dry run)
 
     Returns:
-        Dictionary with update_id for polling status.
+        Dictionary with update_id for polling status, and
+        reused_running_validation (validate_only only).
     """
+    if validate_only:
+        update_id = _find_running_validation(
+            pipeline_id=pipeline_id,
+            refresh_selection=refresh_selection,
+            full_refresh=full_refresh,
+            full_refresh_selection=full_refresh_selection,
+        )
+        if update_id is not None:
+            return {"update_id": update_id, "reused_running_validation": True}
+
     update_id = _start_update(
         pipeline_id=pipeline_id,
         refresh_selection=refresh_selection,
         full_refresh=full_refresh,
         full_refresh_selection=full_refresh_selection,
         validate_only=validate_only,
+        reuse_running_validation=False,
     )
+    if validate_only:
+        return {"update_id": update_id, "reused_running_validation": False}
     return {"update_id": update_id}
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def get_update(pipeline_id: str, update_id: str) -> Dict[str, Any]:
     """
     Get pipeline update status and results.
@@ -201,10 +303,45 @@ def get_update(pipeline_id: str, update_id: str) -> Dict[str, Any]:
         Dictionary with update status (QUEUED, RUNNING, COMPLETED, FAILED, etc.)
     """
     result = _get_update(pipeline_id=pipeline_id, update_id=update_id)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
+
+
+@mcp.tool
+@_wrap_sync_in_thread
+def wait_for_update(
+    pipeline_id: str,
+    update_id: str,
+    last_state: str = None,
+    timeout: int = 60,
+) -> Dict[str, Any]:
+    """
+    Wait for a pipeline update to change state, instead of polling get_update.
+
+    Blocks until the update's state differs from last_state, the update
+    reaches a terminal state (COMPLETED, FAILED, CANCELED), or the timeout
+    expires, then returns the same payload as get_update. Pass the state from
+    the previous response as last_state to wait for the next transition.
+
+    Args:
+        pipeline_id: Pipeline ID
+        update_id: Update ID from start_update
+        last_state: Last known state (e.g. "RUNNING"). If omitted, waits for a terminal state.
+        timeout: Maximum wait in seconds (default: 60, max: 300)
+
+    Returns:
+        Dictionary with update status (QUEUED, RUNNING, COMPLETED, FAILED, etc.)
+    """
+    result = _wait_for_update_change(
+        pipeline_id=pipeline_id,
+        update_id=update_id,
+        last_state=last_state or None,
+        timeout=max(0, min(timeout, 300)),
+    )
+    return _to_dict(result)
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def stop_pipeline(pipeline_id: str) -> Dict[str, str]:
     """
     Stop a running pipeline.
@@ -220,27 +357,34 @@ def stop_pipeline(pipeline_id: str) -> Dict[str, str]:
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def get_pipeline_events(
     pipeline_id: str,
     max_results: int = 100,
+    filter: str = None,
 ) -> List[Dict[str, Any]]:
     """
     Get pipeline events, issues, and error messages.
 
-    Use this to debug pipeline failures.
+    Use this to debug pipeline failures. Use filter to fetch only the events
+    you need instead of raising max_results.
 
     Args:
         pipeline_id: Pipeline ID
         max_results: Maximum number of events to return (default: 100)
+        filter: Optional server-side filter, e.g. "level='ERROR'" or
+            "timestamp > '2025-01-01T00:00:00Z'"
 
     Returns:
-        List of event dictionaries with error details.
+        List of event dictionaries with error details, most recent first.
     """
-    events = _get_pipeline_events(pipeline_id=pipeline_id, max_results=max_results)
-    return [e.as_dict() if hasattr(e, "as_dict") else vars(e) for e in events]
+    events = _iter_pipeline_events(pipeline_id=pipeline_id, max_results=max_results, filter=filter or None)
+    # PipelineEvent is always an SDK dataclass, so call as_dict directly per event
+    return [e.as_dict() for e in events]
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def create_or_update_pipeline(
     name: str,
     root_path: str,
@@ -316,10 +460,7 @@ def create_or_update_pipeline(
             }
         )
     """
-    # Auto-inject default tags into extra_settings; user tags take precedence
-    extra_settings = extra_settings or {}
-    extra_settings.setdefault("tags", {})
-    extra_settings["tags"] = {**get_default_tags(), **extra_settings["tags"]}
+    extra_settings = _with_default_tags(extra_settings)
 
     result = _create_or_update_pipeline(
         name=name,
@@ -334,25 +475,13 @@ def create_or_update_pipeline(
         extra_settings=extra_settings,
     )
 
-    # Track resource on successful create/update
-    try:
-        result_dict = result.to_dict()
-        pipeline_id = result_dict.get("pipeline_id")
-        if pipeline_id:
-            from ..manifest import track_resource
-
-            track_resource(
-                resource_type="pipeline",
-                name=name,
-                resource_id=pipeline_id,
-            )
-    except Exception:
-        pass  # best-effort tracking
-
-    return result.to_dict()
+    result_dict = result.to_dict()
+    _track_pipeline(name, result_dict.get("pipeline_id"))
+    return result_dict
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def find_pipeline_by_name(name: str) -> Dict[str, Any]:
     """
     Find a pipeline by name and return its ID.
@@ -38,6 +38,10 @@ from databricks_tools_core.unity_catalog import (
     create_volume as _create_volume,
     update_volume as _update_volume,
     delete_volume as _delete_volume,
+    # Bulk deletes
+    delete_catalogs as _delete_catalogs,
+    delete_schemas as _delete_schemas,
+    delete_volumes as _delete_volumes,
     # Functions
     list_functions as _list_functions,
     get_function as _get_function,
@@ -104,7 +108,7 @@ from databricks_tools_core.unity_catalog import (
 )
 
 from ..manifest import register_deleter
-from ..server import mcp
+from ..server import mcp, _wrap_sync_in_thread
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +143,26 @@ def _auto_tag(object_type: str, full_name: str) -> None:
             logger.warning("Failed to set tag %s=%s on %s '%s'", key, value, object_type, full_name, exc_info=True)
 
 
+def _track(resource_type: str, name: str, resource_id: str) -> None:
+    """Record a created UC object in the manifest (best-effort)."""
+    try:
+        from ..manifest import track_resource
+
+        track_resource(resource_type=resource_type, name=name, resource_id=resource_id)
+    except Exception:
+        logger.warning("Failed to track %s '%s' in manifest", resource_type, resource_id, exc_info=True)
+
+
+def _untrack(resource_type: str, resource_id: str) -> None:
+    """Remove a deleted UC object from the manifest (best-effort)."""
+    try:
+        from ..manifest import remove_resource
+
+        remove_resource(resource_type=resource_type, resource_id=resource_id)
+    except Exception:
+        logger.warning("Failed to remove %s '%s' from manifest", resource_type, resource_id, exc_info=True)
+
+
 def _to_dict(obj: Any) -> Dict[str, Any]:
     """Convert SDK objects to serializable dicts."""
     if isinstance(obj, dict):
@@ -155,12 +179,25 @@ def _to_dict_list(items: list) -> List[Dict[str, Any]]:
     return [_to_dict(item) for item in items]
 
 
+def _bulk_delete_response(resource_type: str, results: list) -> Dict[str, Any]:
+    """Build the bulk delete response, untracking each object that was deleted."""
+    items = []
+    for r in results:
+        if not r.success:
+            items.append({"full_name": r.key, "status": "failed", "error": r.error})
+            continue
+        _untrack(resource_type, r.key)
+        items.append({"full_name": r.key, "status": "deleted"})
+    return {"items": items}
+
+
 # =============================================================================
 # Tool 1: manage_uc_objects
 # =============================================================================
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_objects(
     object_type: str,
     action: str,
@@ -177,6 +214,7 @@ def manage_uc_objects(
     properties: Dict[str, str] = None,
     isolation_mode: str = None,
     force: bool = False,
+    full_names: List[str] = None,
 ) -> Dict[str, Any]:
     """
     Manage Unity Catalog namespace objects: catalogs, schemas, volumes, functions.
@@ -204,12 +242,28 @@ def manage_uc_objects(
         properties: Key-value properties (for catalog create)
         isolation_mode: "OPEN" or "ISOLATED" (for catalog update)
         force: Force deletion (default: False)
+        full_names: Several full names to delete in one call (for catalog/schema/volume delete).
+                    Deleted concurrently; a failure on one does not stop the others.
 
     Returns:
         Dict with operation result. For list: {"items": [...]}. For get/create/update: object details.
+        For delete with full_names: {"items": [{"full_name", "status": "deleted"|"failed", "error"?}]}.
     """
     otype = object_type.lower()
 
+    if action == "delete" and full_names:
+        if otype == "catalog":
+            return _bulk_delete_response("catalog", _delete_catalogs(catalog_names=full_names, force=force))
+        if otype == "schema":
+            return _bulk_delete_response("schema", _delete_schemas(full_schema_names=full_names))
+        if otype == "volume":
+            return _bulk_delete_response("volume", _delete_volumes(full_volume_names=full_names))
+        raise ValueError(f"full_names is not supported for object_type='{object_type}'")
+
+    # get/update/delete address an existing object; catalogs may also be named via `name`
+    if action in ("get", "update", "delete") and not (full_name or (otype == "catalog" and name)):
+        raise ValueError(f"full_name is required for action='{action}' on object_type='{object_type}'")
+
     if otype == "catalog":
         if action == "create":
             result = _to_dict(
@@ -221,16 +275,7 @@ def manage_uc_objects(
                 )
             )
             _auto_tag("catalog", name)
-            try:
-                from ..manifest import track_resource
-
-                track_resource(
-                    resource_type="catalog",
-                    name=name,
-                    resource_id=result.get("name", name),
-                )
-            except Exception:
-                pass
+            _track("catalog", name, result.get("name", name))
             return result
         elif action == "get":
             return _to_dict(_get_catalog(catalog_name=full_name or name))
@@ -248,25 +293,15 @@ def manage_uc_objects(
             )
         elif action == "delete":
             _delete_catalog(catalog_name=full_name or name, force=force)
-            try:
-                from ..manifest import remove_resource
-
-                remove_resource(resource_type="catalog", resource_id=full_name or name)
-            except Exception:
-                pass
+            _untrack("catalog", full_name or name)
             return {"status": "deleted", "catalog": full_name or name}
 
     elif otype == "schema":
         if action == "create":
             result = _to_dict(_create_schema(catalog_name=catalog_name, schema_name=name, comment=comment))
             _auto_tag("schema", f"{catalog_name}.{name}")
-            try:
-                from ..manifest import track_resource
-
-                full_schema = result.get("full_name") or f"{catalog_name}.{name}"
-                track_resource(resource_type="schema", name=full_schema, resource_id=full_schema)
-            except Exception:
-                logger.warning("Failed to track schema in manifest", exc_info=True)
+            full_schema = result.get("full_name") or f"{catalog_name}.{name}"
+            _track("schema", full_schema, full_schema)
             return result
         elif action == "get":
             return _to_dict(_get_schema(full_schema_name=full_name))
@@ -283,12 +318,7 @@ def manage_uc_objects(
             )
         elif action == "delete":
             _delete_schema(full_schema_name=full_name)
-            try:
-                from ..manifest import remove_resource
-
-                remove_resource(resource_type="schema", resource_id=full_name)
-            except Exception:
-                pass
+            _untrack("schema", full_name)
             return {"status": "deleted", "schema": full_name}
 
     elif otype == "volume":
@@ -304,13 +334,8 @@ def manage_uc_objects(
                 )
             )
             _auto_tag("volume", f"{catalog_name}.{schema_name}.{name}")
-            try:
-                from ..manifest import track_resource
-
-                full_vol = result.get("full_name") or f"{catalog_name}.{schema_name}.{name}"
-                track_resource(resource_type="volume", name=full_vol, resource_id=full_vol)
-            except Exception:
-                pass
+            full_vol = result.get("full_name") or f"{catalog_name}.{schema_name}.{name}"
+            _track("volume", full_vol, full_vol)
             return result
         elif action == "get":
             return _to_dict(_get_volume(full_volume_name=full_name))
@@ -327,12 +352,7 @@ def manage_uc_objects(
             )
         elif action == "delete":
             _delete_volume(full_volume_name=full_name)
-            try:
-                from ..manifest import remove_resource
-
-                remove_resource(resource_type="volume", resource_id=full_name)
-            except Exception:
-                pass
+            _untrack("volume", full_name)
             return {"status": "deleted", "volume": full_name}
 
     elif otype == "function":
@@ -358,6 +378,7 @@ def manage_uc_objects(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_grants(
     action: str,
     securable_type: str,
@@ -418,6 +439,7 @@ def manage_uc_grants(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_storage(
     resource_type: str,
     action: str,
@@ -530,6 +552,7 @@ def manage_uc_storage(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_connections(
     action: str,
     name: str = None,
@@ -608,6 +631,7 @@ def manage_uc_connections(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_tags(
     action: str,
     object_type: str = None,
@@ -708,6 +732,7 @@ def manage_uc_tags(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_security_policies(
     action: str,
     table_name: str = None,
@@ -791,6 +816,7 @@ def manage_uc_security_policies(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_monitors(
     action: str,
     table_name: str,
@@ -849,6 +875,7 @@ def manage_uc_monitors(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_uc_sharing(
     resource_type: str,
     action: str,
@@ -953,6 +980,7 @@ def manage_uc_sharing(
 
 
 @mcp.tool
+@_wrap_sync_in_thread
 def manage_metric_views(
     action: str,
     full_name: str,
@@ -1037,16 +1065,7 @@ def manage_metric_views(
             or_replace=or_replace,
             warehouse_id=warehouse_id,
         )
-        try:
-            from ..manifest import track_resource
-
-            track_resource(
-                resource_type="metric_view",
-                name=full_name,
-                resource_id=full_name,
-            )
-        except Exception:
-            pass
+        _track("metric_view", full_name, full_name)
         return result
     elif act == "alter":
         return _alter_metric_view(
@@ -1085,12 +1104,7 @@ def manage_metric_views(
             full_name=full_name,
             warehouse_id=warehouse_id,
         )
-        try:
-            from ..manifest import remove_resource
-
-            remove_resource(resource_type="metric_view", resource_id=full_name)
-        except Exception:
-            pass
+        _untrack("metric_view", full_name)
         return result
     elif act == "grant":
         return _grant_metric_view(
@@ -0,0 +1,19 @@
+"""Tests for the resource tracking manifest."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from databricks_mcp_server import manifest
+
+
+def test_concurrent_tracking_keeps_every_entry(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: manifest.track_resource("schema", f"main.s{i}", f"main.s{i}"), range(40)))
+
+    assert len(manifest.list_resources("schema")) == 40
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: manifest.remove_resource("schema", f"main.s{i}"), range(0, 40, 2)))
+
+    assert sorted(r["id"] for r in manifest.list_resources("schema")) == sorted(f"main.s{i}" for i in range(1, 40, 2))
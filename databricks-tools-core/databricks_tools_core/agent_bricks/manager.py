@@ -19,6 +19,7 @@ import requests
 from databricks.sdk import WorkspaceClient
 
 from ..auth import get_workspace_client, get_current_username
+from ..client import get_http_session
 from .models import (
     EndpointStatus,
     EvaluationRunDict,
@@ -1120,7 +1121,7 @@ class AgentBricksManager:
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         headers = self.w.config.authenticate()
         url = f"{self.w.config.host}{path}"
-        response = requests.get(url, headers=headers, params=params or {}, timeout=20)
+        response = get_http_session().get(url, headers=headers, params=params or {}, timeout=20)
         if response.status_code >= 400:
             self._handle_response_error(response, "GET", path)
         return response.json()
@@ -1129,7 +1130,7 @@ class AgentBricksManager:
         headers = self.w.config.authenticate()
         headers["Content-Type"] = "application/json"
         url = f"{self.w.config.host}{path}"
-        response = requests.post(url, headers=headers, json=body, timeout=timeout)
+        response = get_http_session().post(url, headers=headers, json=body, timeout=timeout)
         if response.status_code >= 400:
             self._handle_response_error(response, "POST", path)
         return response.json()
@@ -1138,7 +1139,7 @@ class AgentBricksManager:
         headers = self.w.config.authenticate()
         headers["Content-Type"] = "application/json"
         url = f"{self.w.config.host}{path}"
-        response = requests.patch(url, headers=headers, json=body, timeout=20)
+        response = get_http_session().patch(url, headers=headers, json=body, timeout=20)
         if response.status_code >= 400:
             self._handle_response_error(response, "PATCH", path)
         return response.json()
@@ -1146,7 +1147,7 @@ class AgentBricksManager:
     def _delete(self, path: str) -> Dict[str, Any]:
         headers = self.w.config.authenticate()
         url = f"{self.w.config.host}{path}"
-        response = requests.delete(url, headers=headers, timeout=20)
+        response = get_http_session().delete(url, headers=headers, timeout=20)
         if response.status_code >= 400:
             self._handle_response_error(response, "DELETE", path)
         return response.json()
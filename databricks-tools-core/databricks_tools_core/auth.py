@@ -25,10 +25,13 @@ Usage in functions:
 
 import logging
 import os
+import threading
+from collections import OrderedDict
 from contextvars import ContextVar
-from typing import Optional
+from typing import Optional, Tuple
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.config import Config
 
 from .identity import PRODUCT_NAME, PRODUCT_VERSION, tag_client
 
@@ -38,6 +41,16 @@ logger = logging.getLogger(__name__)
 _current_username: Optional[str] = None
 _current_username_fetched: bool = False
 
+# Cached WorkspaceClients keyed by the auth settings they were built from.
+# Building a client resolves config/auth and sets up an HTTP session, so
+# reusing it keeps the connection pool warm across tool calls.
+_MAX_CACHED_CLIENTS = 32
+_client_cache: "OrderedDict[Tuple[Optional[str], ...], WorkspaceClient]" = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+# Size of the HTTP connection pool behind each WorkspaceClient
+_CONNECTION_POOL_SIZE = 32
+
 
 def _has_oauth_credentials() -> bool:
     """Check if OAuth credentials (SP) are configured in environment."""
@@ -73,6 +86,26 @@ def clear_databricks_auth() -> None:
     _token_ctx.set(None)
 
 
+def _client_cache_key(host: Optional[str], token: Optional[str]) -> Tuple[Optional[str], ...]:
+    """Build the cache key identifying which credentials a client is built from."""
+    if _has_oauth_credentials():
+        return (
+            "oauth",
+            host or os.environ.get("DATABRICKS_HOST", ""),
+            os.environ.get("DATABRICKS_CLIENT_ID", ""),
+            os.environ.get("DATABRICKS_CLIENT_SECRET", ""),
+        )
+    if host:
+        return ("host", host, token)
+    # Default auth resolves from env vars / config file, so key on the env vars it reads
+    return (
+        "default",
+        os.environ.get("DATABRICKS_HOST"),
+        os.environ.get("DATABRICKS_TOKEN"),
+        os.environ.get("DATABRICKS_CONFIG_PROFILE"),
+    )
+
+
 def get_workspace_client() -> WorkspaceClient:
     """Get a WorkspaceClient using context auth or environment variables.
 
@@ -82,41 +115,68 @@ def get_workspace_client() -> WorkspaceClient:
     2. Context variables with explicit token (PAT auth for development)
     3. Fall back to default authentication (env vars, config file)
 
+    Clients are cached per set of credentials, so repeated calls reuse the
+    same resolved auth and HTTP connection pool instead of rebuilding them.
+
     Returns:
         Configured WorkspaceClient instance
     """
     host = _host_ctx.get()
     token = _token_ctx.get()
-
-    # Common kwargs for product identification in user-agent
-    product_kwargs = dict(product=PRODUCT_NAME, product_version=PRODUCT_VERSION)
-
+    key = _client_cache_key(host, token)
+
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is not None:
+            _client_cache.move_to_end(key)
+            return client
+
+    # Resolving auth can hit the network (e.g. OAuth endpoint discovery), so build
+    # outside the lock to avoid one slow login stalling every other caller
+    client = _create_workspace_client(host, token)
+
+    with _client_cache_lock:
+        # Another thread may have built a client for the same key meanwhile; keep the first
+        cached = _client_cache.get(key)
+        if cached is not None:
+            _client_cache.move_to_end(key)
+            return cached
+        _client_cache[key] = client
+        if len(_client_cache) > _MAX_CACHED_CLIENTS:
+            _client_cache.popitem(last=False)
+        return client
+
+
+def _create_workspace_client(host: Optional[str], token: Optional[str]) -> WorkspaceClient:
+    """Create a new tagged WorkspaceClient for the given context credentials."""
     # In Databricks Apps (OAuth credentials in env), explicitly use OAuth M2M
     # This prevents the SDK from detecting other auth methods like PAT or config file
     if _has_oauth_credentials():
-        oauth_host = host or os.environ.get("DATABRICKS_HOST", "")
-        client_id = os.environ.get("DATABRICKS_CLIENT_ID", "")
-        client_secret = os.environ.get("DATABRICKS_CLIENT_SECRET", "")
-
-        # Explicitly configure OAuth M2M to prevent auth conflicts
-        return tag_client(
-            WorkspaceClient(
-                host=oauth_host,
-                client_id=client_id,
-                client_secret=client_secret,
-                **product_kwargs,
-            )
+        auth_kwargs = dict(
+            host=host or os.environ.get("DATABRICKS_HOST", ""),
+            client_id=os.environ.get("DATABRICKS_CLIENT_ID", ""),
+            client_secret=os.environ.get("DATABRICKS_CLIENT_SECRET", ""),
         )
-
     # Development mode: use explicit token if provided
-    if host and token:
-        return tag_client(WorkspaceClient(host=host, token=token, **product_kwargs))
-
-    if host:
-        return tag_client(WorkspaceClient(host=host, **product_kwargs))
-
+    elif host and token:
+        auth_kwargs = dict(host=host, token=token)
+    elif host:
+        auth_kwargs = dict(host=host)
     # Fall back to default authentication (env vars, config file)
-    return tag_client(WorkspaceClient(**product_kwargs))
+    else:
+        auth_kwargs = {}
+
+    config = Config(
+        **auth_kwargs,
+        # Product identification in user-agent
+        product=PRODUCT_NAME,
+        product_version=PRODUCT_VERSION,
+        # Cached clients are shared by all concurrent tool calls; the SDK's
+        # default pool (20) blocks callers once exhausted.
+        max_connection_pools=_CONNECTION_POOL_SIZE,
+        max_connections_per_pool=_CONNECTION_POOL_SIZE,
+    )
+    return tag_client(WorkspaceClient(config=config))
 
 
 def get_current_username() -> Optional[str]:
@@ -9,13 +9,43 @@ project name so that API calls are attributable in ``system.access.audit``.
 """
 
 import os
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict, Any, Optional, Callable
 import requests
+from requests.adapters import HTTPAdapter
 
 from databricks.sdk import WorkspaceClient
 
 from .identity import PRODUCT_NAME, PRODUCT_VERSION, tag_client
 
+# Max keep-alive connections kept per host by the shared session
+_HTTP_POOL_SIZE = 32
+
+
+def _create_http_session() -> requests.Session:
+    """Create a requests.Session with a connection pool sized for concurrent tool calls."""
+    session = requests.Session()
+    # The session is shared across callers with different credentials, so never
+    # let cookies from one response be replayed on another caller's request
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_maxsize=_HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_http_session = _create_http_session()
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide session used for raw REST calls.
+
+    Reusing one session keeps TCP/TLS connections alive between calls, so
+    only the first request to a workspace pays the handshake cost.
+    Authentication headers are passed per request, never stored on the session.
+    """
+    return _http_session
+
 
 def _has_oauth_credentials() -> bool:
     """Check if OAuth credentials (SP) are configured in environment."""
@@ -139,6 +169,8 @@ class DatabricksClient:
         # Store the authenticate function for getting fresh headers
         self._authenticate: Callable[[], dict] = self._sdk_client.config.authenticate
 
+        self._session = get_http_session()
+
         # Initialize Files API
         self.files = FilesAPI(self)
 
@@ -169,7 +201,7 @@ class DatabricksClient:
             requests.HTTPError: If request fails
         """
         url = f"{self.host}{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -188,7 +220,7 @@ class DatabricksClient:
             requests.HTTPError: If request fails
         """
         url = f"{self.host}{endpoint}"
-        response = requests.post(url, headers=self.headers, json=json)
+        response = self._session.post(url, headers=self.headers, json=json)
         response.raise_for_status()
         return response.json()
 
@@ -207,7 +239,7 @@ class DatabricksClient:
             requests.HTTPError: If request fails
         """
         url = f"{self.host}{endpoint}"
-        response = requests.patch(url, headers=self.headers, json=json)
+        response = self._session.patch(url, headers=self.headers, json=json)
         response.raise_for_status()
         return response.json()
 
@@ -237,12 +269,12 @@ class DatabricksClient:
 
         if data is not None:
             headers = {**self.headers, "Content-Type": "application/octet-stream"}
-            response = requests.put(url, data=data, params=params, headers=headers)
+            response = self._session.put(url, data=data, params=params, headers=headers)
         elif json is not None:
             headers = {**self.headers, "Content-Type": "application/json"}
-            response = requests.put(url, json=json, params=params, headers=headers)
+            response = self._session.put(url, json=json, params=params, headers=headers)
         else:
-            response = requests.put(url, params=params, headers=self.headers)
+            response = self._session.put(url, params=params, headers=self.headers)
 
         response.raise_for_status()
 
@@ -267,7 +299,7 @@ class DatabricksClient:
             requests.HTTPError: If request fails
         """
         url = f"{self.host}{endpoint}"
-        response = requests.delete(url, headers=self.headers, params=params)
+        response = self._session.delete(url, headers=self.headers, params=params)
         response.raise_for_status()
 
         # Handle 204 No Content responses
@@ -1,3 +1,6 @@
 """Common utilities shared across product lines."""
 
-__all__ = []
+from .bulk import BULK_MAX_WORKERS, BulkResult, run_bulk
+from .cache import TTLCache
+
+__all__ = ["BULK_MAX_WORKERS", "BulkResult", "TTLCache", "run_bulk"]
@@ -0,0 +1,57 @@
+"""
+Common - Concurrent bulk calls
+
+Runs one API call per key on a small thread pool, so operating on N objects
+takes roughly as long as the slowest single call rather than the sum of all.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, List, Optional
+
+# Max concurrent API calls issued by run_bulk
+BULK_MAX_WORKERS = 8
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one key within a bulk operation."""
+
+    key: Hashable
+    success: bool
+    result: Any = None
+    error: Optional[str] = None
+
+
+def run_bulk(
+    fn: Callable[[Any], Any], keys: Iterable[Hashable], max_workers: int = BULK_MAX_WORKERS
+) -> List[BulkResult]:
+    """
+    Call fn(key) concurrently for each unique key.
+
+    Each call runs in a copy of the caller's context so per-request auth
+    (see auth.set_databricks_auth) applies inside the worker threads.
+    Failures are captured per key instead of aborting the batch.
+
+    Args:
+        fn: Function to call with each key
+        keys: Keys to process (e.g. pipeline IDs or full object names)
+        max_workers: Maximum number of concurrent calls
+
+    Returns:
+        List of BulkResult in input order (duplicates removed)
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return []
+
+    def _call(key: Hashable) -> BulkResult:
+        try:
+            return BulkResult(key=key, success=True, result=fn(key))
+        except Exception as e:
+            return BulkResult(key=key, success=False, error=str(e))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_keys))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, _call, key) for key in unique_keys]
+        return [future.result() for future in futures]
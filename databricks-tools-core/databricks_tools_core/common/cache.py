@@ -0,0 +1,113 @@
+"""
+Common - In-process TTL cache
+
+Small thread-safe cache used to absorb bursts of identical read-only API calls
+(e.g. an agent polling the same pipeline update several times per second).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire ``ttl`` seconds after being stored.
+
+    ``get_or_load`` also coalesces concurrent loads of the same key: the first
+    caller runs the loader while later callers wait for (and share) its result,
+    so N simultaneous identical requests result in a single API call.
+    Loader exceptions are propagated to every waiter and never cached.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for ``key``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                return value
+            del self._entries[key]
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``."""
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value for ``key``, calling ``loader`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    return value
+                del self._entries[key]
+
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            # Only store if nobody invalidated the key while we were loading
+            if self._in_flight.pop(key, None) is future:
+                self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache (no-op if absent)."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._in_flight.pop(key, None)
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key for which ``predicate(key)`` is true."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+            for key in [k for k in self._in_flight if predicate(k)]:
+                del self._in_flight[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._in_flight.clear()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insert an entry, evicting expired and then oldest entries. Caller holds the lock."""
+        now = time.monotonic()
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            for k in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[k]
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -6,10 +6,14 @@ Uses Databricks Command Execution API via SDK.
 """
 
 import datetime
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from typing import Optional, List, Dict, Any, Set, Tuple
+from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.compute import (
     CommandStatus,
     ClusterSource,
+    ContextStatus,
     DataSecurityMode,
     Language,
     ListClustersFilterBy,
@@ -23,6 +27,20 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+_CONTEXT_REUSE_MESSAGE = (
+    "Execution successful. To speed up follow-up commands and maintain "
+    "state (variables, imports), reuse context_id='{context_id}' with "
+    "cluster_id='{cluster_id}'."
+)
+_CONTEXT_DESTROYED_MESSAGE = "Execution successful. Context was destroyed."
+_CONTEXT_POOLED_MESSAGE = (
+    "Execution successful. The context was returned to a shared pool and may be "
+    "picked up by later calls that omit context_id. To keep state (variables, "
+    "imports) private, pass context_id='{context_id}' with cluster_id='{cluster_id}' "
+    "on your next call, which takes it out of the pool."
+)
+
+
 class ExecutionResult:
     """Result from code execution on a Databricks cluster.
 
@@ -38,6 +56,8 @@ class ExecutionResult:
         message: A helpful message about reusing the context.
     """
 
+    __slots__ = ("success", "output", "error", "cluster_id", "context_id", "context_destroyed", "message")
+
     def __init__(
         self,
         success: bool,
@@ -56,15 +76,9 @@ class ExecutionResult:
 
         # Generate helpful message
         if success and context_id and not context_destroyed:
-            self.message = (
-                f"Execution successful. To speed up follow-up commands and maintain "
-                f"state (variables, imports), reuse context_id='{context_id}' with "
-                f"cluster_id='{cluster_id}'."
-            )
+            self.message = _CONTEXT_REUSE_MESSAGE.format(context_id=context_id, cluster_id=cluster_id)
         elif success and context_destroyed:
-            self.message = "Execution successful. Context was destroyed."
-        elif not success:
-            self.message = None
+            self.message = _CONTEXT_DESTROYED_MESSAGE
         else:
             self.message = None
 
@@ -100,6 +114,76 @@ _LANGUAGE_MAP = {
     "r": Language.R,
 }
 
+# Idle contexts that execute_databricks_command created for callers that did
+# not pass a context_id, keyed by (client, cluster_id, language). A pooled
+# context is checked out while a command runs on it and only goes back once
+# that command finished successfully. If a caller passes its context_id
+# explicitly (or destroys it) meanwhile, it is claimed and never checked back
+# in. Both sets only hold contexts that are currently checked out.
+_IDLE_CONTEXT_TTL_SECONDS = 600.0
+_idle_contexts: Dict[Tuple[WorkspaceClient, str, str], Tuple[str, float]] = {}
+_checked_out_contexts: Set[str] = set()
+_claimed_contexts: Set[str] = set()
+_idle_contexts_lock = threading.Lock()
+
+
+def _checkout_idle_context(w: WorkspaceClient, cluster_id: str, language: str) -> Optional[str]:
+    """Take a still-running idle context for this cluster/language, if one is cached."""
+    with _idle_contexts_lock:
+        entry = _idle_contexts.pop((w, cluster_id, language.lower()), None)
+        if entry is None:
+            return None
+        context_id, expires_at = entry
+        _checked_out_contexts.add(context_id)
+
+    try:
+        alive = (
+            expires_at > time.monotonic()
+            and w.command_execution.context_status(cluster_id=cluster_id, context_id=context_id).status
+            == ContextStatus.RUNNING
+        )
+    except Exception:
+        alive = False
+    if not alive:
+        _checkin_idle_context(w, cluster_id, language, context_id, reusable=False)
+        return None
+    return context_id
+
+
+def _claim_context(context_id: str) -> None:
+    """Take an explicitly requested (or destroyed) context out of the pool for good."""
+    with _idle_contexts_lock:
+        if context_id in _checked_out_contexts:
+            _claimed_contexts.add(context_id)
+        for key in [k for k, (ctx, _) in _idle_contexts.items() if ctx == context_id]:
+            del _idle_contexts[key]
+
+
+def _checkin_idle_context(
+    w: WorkspaceClient, cluster_id: str, language: str, context_id: str, reusable: bool = True
+) -> bool:
+    """Return a checked-out context, making it available to the next call for the same cluster/language.
+
+    Args:
+        reusable: False to drop the context from the pool instead, e.g. when its
+            command timed out and may still be running on it
+
+    Returns:
+        True if the context went back to the pool
+    """
+    with _idle_contexts_lock:
+        _checked_out_contexts.discard(context_id)
+        if context_id in _claimed_contexts:
+            _claimed_contexts.discard(context_id)
+            return False
+        if not reusable:
+            return False
+        _idle_contexts[(w, cluster_id, language.lower())] = (
+            context_id,
+            time.monotonic() + _IDLE_CONTEXT_TTL_SECONDS,
+        )
+    return True
+
 
 def list_clusters(
     include_terminated: bool = True,
@@ -192,6 +276,8 @@ def _is_cluster_accessible(cluster, current_user: Optional[str]) -> bool:
 class ClusterSelectionResult:
     """Result from get_best_cluster with details about skipped clusters."""
 
+    __slots__ = ("cluster_id", "skipped_clusters")
+
     def __init__(
         self,
         cluster_id: Optional[str],
@@ -329,31 +415,44 @@ class NoRunningClusterError(Exception):
 
     def _build_message(self) -> str:
         """Build a human-readable error message."""
-        message = "No running cluster available for the current user."
+        parts = ["No running cluster available for the current user."]
 
         if self.startable_clusters:
-            cluster_list = "\n".join(
-                f"  - {c['cluster_name']} ({c['cluster_id']}) - {c['state']}" for c in self.startable_clusters[:10]
-            )
-            message += (
-                f"\n\nYou have {len(self.startable_clusters)} terminated cluster(s) you could start:\n{cluster_list}"
+            parts.append(f"\n\nYou have {len(self.startable_clusters)} terminated cluster(s) you could start:\n")
+            parts.append(
+                "\n".join(
+                    f"  - {c['cluster_name']} ({c['cluster_id']}) - {c['state']}" for c in self.startable_clusters[:10]
+                )
             )
 
         if self.skipped_clusters:
-            skipped_list = "\n".join(
-                f"  - {c['cluster_name']} ({c['cluster_id']}) - owned by {c.get('single_user_name', 'unknown')}"
-                for c in self.skipped_clusters
-            )
-            message += (
+            parts.append(
                 f"\n\n{len(self.skipped_clusters)} running cluster(s) were skipped because they are "
-                f"single-user clusters assigned to a different user:\n{skipped_list}"
+                f"single-user clusters assigned to a different user:\n"
             )
+            parts.append(
+                "\n".join(
+                    f"  - {c['cluster_name']} ({c['cluster_id']}) - owned by {c.get('single_user_name', 'unknown')}"
+                    for c in self.skipped_clusters
+                )
+            )
+
+        parts.append("\n\nSuggestions:\n")
+        parts.extend(f"  {i}. {suggestion}\n" for i, suggestion in enumerate(self.suggestions, 1))
 
-        message += "\n\nSuggestions:\n"
-        for i, suggestion in enumerate(self.suggestions, 1):
-            message += f"  {i}. {suggestion}\n"
+        return "".join(parts)
 
-        return message
+
+# Status message templates for get_cluster_status, keyed by cluster state
+_WAIT_MESSAGE = "Cluster '{name}' is {state_lower}. Please wait and check again in 30-60 seconds."
+_CLUSTER_STATUS_MESSAGES = {
+    "RUNNING": "Cluster '{name}' is running and ready for use.",
+    "PENDING": _WAIT_MESSAGE,
+    "RESTARTING": _WAIT_MESSAGE,
+    "RESIZING": _WAIT_MESSAGE,
+    "TERMINATED": "Cluster '{name}' is terminated.",
+    "TERMINATING": "Cluster '{name}' is shutting down.",
+}
 
 
 def start_cluster(cluster_id: str) -> Dict[str, Any]:
@@ -433,16 +532,8 @@ def get_cluster_status(cluster_id: str) -> Dict[str, Any]:
     cluster_name = cluster.cluster_name or cluster_id
     state = cluster.state.value if cluster.state else "UNKNOWN"
 
-    if state == "RUNNING":
-        message = f"Cluster '{cluster_name}' is running and ready for use."
-    elif state in ("PENDING", "RESTARTING", "RESIZING"):
-        message = f"Cluster '{cluster_name}' is {state.lower()}. Please wait and check again in 30-60 seconds."
-    elif state == "TERMINATED":
-        message = f"Cluster '{cluster_name}' is terminated."
-    elif state == "TERMINATING":
-        message = f"Cluster '{cluster_name}' is shutting down."
-    else:
-        message = f"Cluster '{cluster_name}' is in state: {state}."
+    template = _CLUSTER_STATUS_MESSAGES.get(state, "Cluster '{name}' is in state: {state}.")
+    message = template.format(name=cluster_name, state=state, state_lower=state.lower())
 
     return {
         "cluster_id": cluster_id,
@@ -491,6 +582,7 @@ def destroy_context(cluster_id: str, context_id: str) -> None:
     """
     w = get_workspace_client()
     w.command_execution.destroy(cluster_id=cluster_id, context_id=context_id)
+    _claim_context(context_id)
 
 
 def _execute_on_context(cluster_id: str, context_id: str, code: str, language: str, timeout: int) -> ExecutionResult:
@@ -575,8 +667,12 @@ def execute_databricks_command(
     """
     Execute code on a Databricks cluster.
 
-    If context_id is provided, reuses the existing context (faster, maintains state).
-    If not provided, creates a new context.
+    If context_id is provided, reuses the existing context (faster, maintains state)
+    and takes it out of the shared idle pool, so calls without a context_id will
+    not run on it. If not provided, reuses an idle pooled context auto-created by
+    an earlier call for the same cluster and language within the last 10 minutes
+    (so state from that call may still be present), or creates a new context;
+    if the command succeeds, the context then goes back to the pool.
 
     By default, the context is kept alive for reuse. Set destroy_context_on_completion=True
     to destroy it after execution.
@@ -633,12 +729,22 @@ def execute_databricks_command(
                 startable_clusters=startable_clusters,
             )
 
-    # Create context if not provided
+    # Reuse an idle auto-created context, or create one, if not provided
+    w = get_workspace_client()
     context_created = False
+    pooled = context_id is None
+    if pooled:
+        context_id = _checkout_idle_context(w, cluster_id, language)
+    else:
+        _claim_context(context_id)
     if context_id is None:
         context_id = create_context(cluster_id, language)
         context_created = True
+        if pooled:
+            with _idle_contexts_lock:
+                _checked_out_contexts.add(context_id)
 
+    result = None
     try:
         # Execute command
         result = _execute_on_context(
@@ -654,7 +760,7 @@ def execute_databricks_command(
             try:
                 destroy_context(cluster_id, context_id)
                 result.context_destroyed = True
-                result.message = "Execution successful. Context was destroyed."
+                result.message = _CONTEXT_DESTROYED_MESSAGE
             except Exception:
                 pass  # Ignore cleanup errors
 
@@ -669,6 +775,14 @@ def execute_databricks_command(
                 pass
         raise
 
+    finally:
+        if pooled:
+            # Only a successfully finished command leaves the context idle; after a
+            # timeout or error the command may still be running, so drop it instead
+            reusable = result is not None and result.success and not result.context_destroyed
+            if _checkin_idle_context(w, cluster_id, language, context_id, reusable=reusable):
+                result.message = _CONTEXT_POOLED_MESSAGE.format(context_id=context_id, cluster_id=cluster_id)
+
 
 def run_python_file_on_databricks(
     file_path: str,
@@ -684,7 +798,8 @@ def run_python_file_on_databricks(
     that has been written locally and needs to be executed on Databricks.
 
     If context_id is provided, reuses the existing context (faster, maintains state).
-    If not provided, creates a new context.
+    If not provided, reuses an idle context left by a recent call on the same
+    cluster (and language), or creates a new context.
 
     Args:
         file_path: Local path to the Python file to execute
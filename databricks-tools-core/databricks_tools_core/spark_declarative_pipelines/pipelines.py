@@ -5,9 +5,12 @@ Functions for managing SDP pipeline lifecycle using Databricks Pipelines API.
 All pipelines use Unity Catalog and serverless compute by default.
 """
 
+import asyncio
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from typing import AbstractSet, Iterable, Iterator, List, Optional, Dict, Any, Tuple
 
 from databricks.sdk.service.pipelines import (
     CreatePipelineResponse,
@@ -31,11 +34,15 @@ from databricks.sdk.service.pipelines import (
 )
 
 from ..auth import get_workspace_client
+from ..common import BULK_MAX_WORKERS, BulkResult, TTLCache, run_bulk
 
 
 # Fields that are not valid SDK parameters and should be filtered out
 _INVALID_SDK_FIELDS = {"pipeline_type"}
 
+# Fields create_pipeline always sets from its explicit parameters ('id' is dropped for create)
+_CREATE_EXPLICIT_FIELDS = frozenset({"name", "root_path", "catalog", "schema", "libraries", "id"})
+
 # Fields that need conversion from dict to SDK objects
 _COMPLEX_FIELD_CONVERTERS = {
     "libraries": lambda items: [PipelineLibrary.from_dict(item) for item in items] if items else None,
@@ -53,16 +60,20 @@ _COMPLEX_FIELD_CONVERTERS = {
 }
 
 
-def _convert_extra_settings(extra_settings: Dict[str, Any]) -> Dict[str, Any]:
+def _convert_extra_settings(
+    extra_settings: Dict[str, Any], skip_fields: AbstractSet[str] = frozenset()
+) -> Dict[str, Any]:
     """
     Convert extra_settings dict to SDK-compatible kwargs.
 
     - Filters out invalid fields (e.g., pipeline_type)
+    - Skips fields the caller sets explicitly, so they are not converted only to be overwritten
     - Converts nested dicts to SDK objects (e.g., clusters, event_log)
     - Passes simple types directly
 
     Args:
         extra_settings: Raw dict from user (e.g., from Databricks UI JSON export)
+        skip_fields: Keys that the caller will set itself
 
     Returns:
         Dict with SDK-compatible values
@@ -70,8 +81,8 @@ def _convert_extra_settings(extra_settings: Dict[str, Any]) -> Dict[str, Any]:
     result = {}
 
     for key, value in extra_settings.items():
-        # Skip invalid fields
-        if key in _INVALID_SDK_FIELDS:
+        # Skip invalid fields and fields overridden by explicit parameters
+        if key in _INVALID_SDK_FIELDS or key in skip_fields:
             continue
 
         # Skip None values
@@ -110,9 +121,37 @@ RUNNING_STATES = {
 }
 
 
+# Short-lived cache for the hot polling reads (get_pipeline / get_update).
+# Concurrent identical polls share one API call; entries are keyed by client so
+# callers with different credentials never see each other's results.
+_POLL_CACHE_TTL_SECONDS = 1.0
+_poll_cache = TTLCache(ttl=_POLL_CACHE_TTL_SECONDS)
+
+# Recent validate-only (dry-run) updates, so a repeated validation request can
+# reuse a dry run that is still in progress instead of queuing another one.
+_VALIDATION_CACHE_TTL_SECONDS = 30.0
+_validation_cache = TTLCache(ttl=_VALIDATION_CACHE_TTL_SECONDS)
+
+
+def _invalidate_pipeline_cache(pipeline_id: str) -> None:
+    """Drop cached get_pipeline/get_update results for a pipeline after a mutation."""
+    _poll_cache.invalidate_if(lambda key: key[1] == pipeline_id)
+    _validation_cache.invalidate_if(lambda key: key[0] == pipeline_id)
+
+
+@lru_cache(maxsize=256)
+def _cached_libraries(workspace_file_paths: Tuple[str, ...]) -> Tuple[PipelineLibrary, ...]:
+    """Build (and memoize) PipelineLibrary objects for a tuple of file paths."""
+    return tuple(PipelineLibrary(file=FileLibrary(path=path)) for path in workspace_file_paths)
+
+
 def _build_libraries(workspace_file_paths: List[str]) -> List[PipelineLibrary]:
-    """Build PipelineLibrary list from file paths."""
-    return [PipelineLibrary(file=FileLibrary(path=path)) for path in workspace_file_paths]
+    """Build PipelineLibrary list from file paths, preserving their order."""
+    return list(_cached_libraries(tuple(workspace_file_paths)))
+
+
+# Server-side event filter used when collecting failure details
+_ERROR_EVENTS_FILTER = "level='ERROR'"
 
 
 def _extract_error_details(events: List[PipelineEvent]) -> List[Dict[str, Any]]:
@@ -245,10 +284,10 @@ def create_pipeline(
     w = get_workspace_client()
     libraries = _build_libraries(workspace_file_paths)
 
-    # Start with converted extra_settings as base
+    # Start with converted extra_settings as base ('id' is skipped - create should not have an id)
     kwargs: Dict[str, Any] = {}
     if extra_settings:
-        kwargs = _convert_extra_settings(extra_settings)
+        kwargs = _convert_extra_settings(extra_settings, skip_fields=_CREATE_EXPLICIT_FIELDS)
 
     # Explicit parameters always take precedence
     kwargs["name"] = name
@@ -263,9 +302,6 @@ def create_pipeline(
     if "serverless" not in kwargs:
         kwargs["serverless"] = True
 
-    # Remove 'id' if present - create should not have an id
-    kwargs.pop("id", None)
-
     return w.pipelines.create(**kwargs)
 
 
@@ -273,6 +309,9 @@ def get_pipeline(pipeline_id: str) -> GetPipelineResponse:
     """
     Get pipeline details and configuration.
 
+    Results are cached for about a second so bursts of identical polls
+    share a single API call.
+
     Args:
         pipeline_id: Pipeline ID
 
@@ -280,7 +319,10 @@ def get_pipeline(pipeline_id: str) -> GetPipelineResponse:
         GetPipelineResponse with full pipeline configuration and state
     """
     w = get_workspace_client()
-    return w.pipelines.get(pipeline_id=pipeline_id)
+    return _poll_cache.get_or_load(
+        ("pipeline", pipeline_id, w),
+        lambda: w.pipelines.get(pipeline_id=pipeline_id),
+    )
 
 
 def update_pipeline(
@@ -301,40 +343,43 @@ def update_pipeline(
         root_path: New root folder for source code
         catalog: New catalog name
         schema: New schema name
-        workspace_file_paths: New list of file paths (raw .sql or .py files)
+        workspace_file_paths: New list of file paths (raw .sql or .py files). None keeps
+            the current libraries; an empty list removes them all.
         extra_settings: Optional dict with additional pipeline settings. These are passed
             directly to the Databricks SDK pipelines.update() call. Explicit parameters
             take precedence over values in extra_settings.
             Supports all SDK options: clusters, continuous, development, photon, edition,
             channel, event_log, configuration, notifications, tags, etc.
+
+    Parameters left as None are not changed.
     """
     w = get_workspace_client()
 
+    # Explicit parameters take precedence (only if provided)
+    provided = {
+        "name": name,
+        "root_path": root_path,
+        "catalog": catalog,
+        "schema": schema,
+        "libraries": _build_libraries(workspace_file_paths) if workspace_file_paths is not None else None,
+    }
+    overrides = {k: v for k, v in provided.items() if v is not None}
+
     # Start with converted extra_settings as base
     kwargs: Dict[str, Any] = {}
     if extra_settings:
-        kwargs = _convert_extra_settings(extra_settings)
+        kwargs = _convert_extra_settings(extra_settings, skip_fields=overrides.keys())
 
     # pipeline_id is required and always set
     kwargs["pipeline_id"] = pipeline_id
-
-    # Explicit parameters take precedence (only if provided)
-    if name:
-        kwargs["name"] = name
-    if root_path:
-        kwargs["root_path"] = root_path
-    if catalog:
-        kwargs["catalog"] = catalog
-    if schema:
-        kwargs["schema"] = schema
-    if workspace_file_paths:
-        kwargs["libraries"] = _build_libraries(workspace_file_paths)
+    kwargs.update(overrides)
 
     # Ensure id in kwargs matches pipeline_id (SDK uses both)
     if "id" in kwargs and kwargs["id"] != pipeline_id:
         kwargs["id"] = pipeline_id
 
     w.pipelines.update(**kwargs)
+    _invalidate_pipeline_cache(pipeline_id)
 
 
 def delete_pipeline(pipeline_id: str) -> None:
@@ -346,6 +391,92 @@ def delete_pipeline(pipeline_id: str) -> None:
     """
     w = get_workspace_client()
     w.pipelines.delete(pipeline_id=pipeline_id)
+    _invalidate_pipeline_cache(pipeline_id)
+
+
+def get_pipelines(pipeline_ids: List[str], max_workers: int = BULK_MAX_WORKERS) -> List[BulkResult]:
+    """
+    Get details for several pipelines with concurrent API calls.
+
+    Args:
+        pipeline_ids: Pipeline IDs to fetch
+        max_workers: Maximum number of concurrent requests (default: 8)
+
+    Returns:
+        List of BulkResult (in input order) keyed by pipeline ID, whose result
+        is the GetPipelineResponse, or whose error describes why the fetch failed
+    """
+    return run_bulk(get_pipeline, pipeline_ids, max_workers)
+
+
+def delete_pipelines(pipeline_ids: List[str], max_workers: int = BULK_MAX_WORKERS) -> List[BulkResult]:
+    """
+    Delete several pipelines with concurrent API calls.
+
+    A failure to delete one pipeline does not stop the others.
+
+    Args:
+        pipeline_ids: Pipeline IDs to delete
+        max_workers: Maximum number of concurrent requests (default: 8)
+
+    Returns:
+        List of BulkResult (in input order) keyed by pipeline ID, with
+        per-pipeline success/error
+    """
+    return run_bulk(delete_pipeline, pipeline_ids, max_workers)
+
+
+def _validation_cache_key(
+    pipeline_id: str,
+    w: Any,
+    refresh_selection: Optional[List[str]],
+    full_refresh: bool,
+    full_refresh_selection: Optional[List[str]],
+) -> tuple:
+    return (
+        pipeline_id,
+        w,
+        tuple(refresh_selection or ()),
+        full_refresh,
+        tuple(full_refresh_selection or ()),
+    )
+
+
+def find_running_validation(
+    pipeline_id: str,
+    refresh_selection: Optional[List[str]] = None,
+    full_refresh: bool = False,
+    full_refresh_selection: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    Find an identical dry run started in the last ~30 seconds that is still in progress.
+
+    Such a dry run validates the source code as it was when it started, so
+    callers that changed pipeline files since should start a new one instead.
+
+    Args:
+        pipeline_id: Pipeline ID
+        refresh_selection: List of table names to refresh
+        full_refresh: If True, performs full refresh of all tables
+        full_refresh_selection: List of table names for full refresh
+
+    Returns:
+        Update ID of the running dry run, or None if there is none (or its
+        status can no longer be fetched)
+    """
+    w = get_workspace_client()
+    cache_key = _validation_cache_key(pipeline_id, w, refresh_selection, full_refresh, full_refresh_selection)
+    update_id = _validation_cache.get(cache_key)
+    if update_id is None:
+        return None
+    try:
+        update = get_update(pipeline_id, update_id).update
+    except Exception:
+        update = None
+    if update is None or update.state in TERMINAL_STATES:
+        _validation_cache.invalidate(cache_key)
+        return None
+    return update_id
 
 
 def start_update(
@@ -354,30 +485,55 @@ def start_update(
     full_refresh: bool = False,
     full_refresh_selection: Optional[List[str]] = None,
     validate_only: bool = False,
+    reuse_running_validation: bool = False,
 ) -> str:
     """
     Start a pipeline update or dry-run validation.
 
+    With reuse_running_validation=True, a validate-only request identical to
+    one started in the last ~30 seconds returns the earlier update ID while
+    that dry run is still in progress (see find_running_validation). It is off
+    by default because that dry run may have validated sources edited since.
+
     Args:
         pipeline_id: Pipeline ID
         refresh_selection: List of table names to refresh
         full_refresh: If True, performs full refresh of all tables
         full_refresh_selection: List of table names for full refresh
         validate_only: If True, performs dry-run validation without updating data
+        reuse_running_validation: If True, reuse an identical in-progress dry run
 
     Returns:
         Update ID for polling status
     """
     w = get_workspace_client()
 
-    response = w.pipelines.start_update(
-        pipeline_id=pipeline_id,
-        refresh_selection=refresh_selection,
-        full_refresh=full_refresh,
-        full_refresh_selection=full_refresh_selection,
-        validate_only=validate_only,
-    )
-
+    # Only forward the options that were actually requested
+    kwargs = {
+        k: v
+        for k, v in (
+            ("refresh_selection", refresh_selection),
+            ("full_refresh", full_refresh or None),
+            ("full_refresh_selection", full_refresh_selection),
+            ("validate_only", validate_only or None),
+        )
+        if v is not None
+    }
+
+    if not validate_only:
+        response = w.pipelines.start_update(pipeline_id=pipeline_id, **kwargs)
+        _invalidate_pipeline_cache(pipeline_id)
+        return response.update_id
+
+    if reuse_running_validation:
+        update_id = find_running_validation(pipeline_id, refresh_selection, full_refresh, full_refresh_selection)
+        if update_id is not None:
+            return update_id
+
+    response = w.pipelines.start_update(pipeline_id=pipeline_id, **kwargs)
+    _invalidate_pipeline_cache(pipeline_id)
+    cache_key = _validation_cache_key(pipeline_id, w, refresh_selection, full_refresh, full_refresh_selection)
+    _validation_cache.set(cache_key, response.update_id)
     return response.update_id
 
 
@@ -385,6 +541,9 @@ def get_update(pipeline_id: str, update_id: str) -> GetUpdateResponse:
     """
     Get pipeline update status and results.
 
+    Results are cached for about a second so bursts of identical polls
+    share a single API call.
+
     Args:
         pipeline_id: Pipeline ID
         update_id: Update ID from start_update
@@ -393,7 +552,39 @@ def get_update(pipeline_id: str, update_id: str) -> GetUpdateResponse:
         GetUpdateResponse with update status (QUEUED, RUNNING, COMPLETED, FAILED, etc.)
     """
     w = get_workspace_client()
-    return w.pipelines.get_update(pipeline_id=pipeline_id, update_id=update_id)
+    return _poll_cache.get_or_load(
+        ("update", pipeline_id, w, update_id),
+        lambda: w.pipelines.get_update(pipeline_id=pipeline_id, update_id=update_id),
+    )
+
+
+async def get_update_async(pipeline_id: str, update_id: str) -> GetUpdateResponse:
+    """
+    Async variant of get_update that runs the blocking SDK call in a worker thread.
+
+    Args:
+        pipeline_id: Pipeline ID
+        update_id: Update ID from start_update
+
+    Returns:
+        GetUpdateResponse with update status
+    """
+    return await asyncio.to_thread(get_update, pipeline_id, update_id)
+
+
+async def get_updates_async(updates: Iterable[Tuple[str, str]]) -> List[GetUpdateResponse]:
+    """
+    Get the status of several pipeline updates concurrently.
+
+    Wall time is roughly that of the slowest request instead of the sum of all.
+
+    Args:
+        updates: (pipeline_id, update_id) pairs
+
+    Returns:
+        List of GetUpdateResponse in the same order as ``updates``
+    """
+    return list(await asyncio.gather(*(get_update_async(p, u) for p, u in updates)))
 
 
 def stop_pipeline(pipeline_id: str) -> None:
@@ -405,9 +596,35 @@ def stop_pipeline(pipeline_id: str) -> None:
     """
     w = get_workspace_client()
     w.pipelines.stop(pipeline_id=pipeline_id)
+    _invalidate_pipeline_cache(pipeline_id)
+
+
+def iter_pipeline_events(
+    pipeline_id: str, max_results: int = 100, filter: Optional[str] = None
+) -> Iterator[PipelineEvent]:
+    """
+    Iterate over pipeline events, most recent first.
+
+    The SDK's max_results is a page size and its iterator keeps paging through
+    the whole event log, so iteration stops after max_results events to avoid
+    fetching pages that would be discarded.
 
+    Args:
+        pipeline_id: Pipeline ID
+        max_results: Maximum number of events to yield
+        filter: Optional server-side filter expression, e.g. "level='ERROR'"
+            or "timestamp > '2025-01-01T00:00:00Z'"
+
+    Returns:
+        Iterator of PipelineEvent objects
+    """
+    w = get_workspace_client()
+    kwargs = {"filter": filter} if filter else {}
+    events = w.pipelines.list_pipeline_events(pipeline_id=pipeline_id, max_results=max_results, **kwargs)
+    return islice(events, max_results)
 
-def get_pipeline_events(pipeline_id: str, max_results: int = 100) -> List[PipelineEvent]:
+
+def get_pipeline_events(pipeline_id: str, max_results: int = 100, filter: Optional[str] = None) -> List[PipelineEvent]:
     """
     Get pipeline events, issues, and error messages.
 
@@ -416,13 +633,12 @@ def get_pipeline_events(pipeline_id: str, max_results: int = 100) -> List[Pipeli
     Args:
         pipeline_id: Pipeline ID
         max_results: Maximum number of events to return
+        filter: Optional server-side filter expression, e.g. "level='ERROR'"
 
     Returns:
         List of PipelineEvent objects with error details
     """
-    w = get_workspace_client()
-    events = w.pipelines.list_pipeline_events(pipeline_id=pipeline_id, max_results=max_results)
-    return list(events)
+    return list(iter_pipeline_events(pipeline_id, max_results=max_results, filter=filter))
 
 
 def wait_for_pipeline_update(
@@ -479,7 +695,7 @@ def wait_for_pipeline_update(
 
             # If failed, get detailed error information
             if state == UpdateInfoState.FAILED:
-                events = get_pipeline_events(pipeline_id, max_results=50)
+                events = get_pipeline_events(pipeline_id, max_results=50, filter=_ERROR_EVENTS_FILTER)
                 result["errors"] = _extract_error_details(events)
 
             return result
@@ -487,6 +703,49 @@ def wait_for_pipeline_update(
         time.sleep(poll_interval)
 
 
+def wait_for_update_change(
+    pipeline_id: str,
+    update_id: str,
+    last_state: Optional[str] = None,
+    timeout: int = 60,
+) -> GetUpdateResponse:
+    """
+    Block until a pipeline update changes state, finishes, or the timeout expires.
+
+    Long-poll alternative to calling get_update in a loop: checks are spaced
+    with exponential backoff (1s up to 5s) and the call returns as soon as the
+    state differs from last_state or reaches a terminal state.
+
+    Args:
+        pipeline_id: Pipeline ID
+        update_id: Update ID from start_update
+        last_state: State the caller already knows about (e.g. "RUNNING",
+            case-insensitive). If None, returns on the first terminal state.
+        timeout: Maximum time to wait in seconds (default: 60)
+
+    Returns:
+        Latest GetUpdateResponse (returned without error if the timeout expires)
+    """
+    deadline = time.monotonic() + timeout
+    delay = 1.0
+    # State names are upper-case in the API; accept "running" as well as "RUNNING"
+    last_state = last_state.upper() if last_state else None
+
+    while True:
+        response = get_update(pipeline_id, update_id)
+        state = response.update.state if response.update else None
+
+        if state in TERMINAL_STATES or (last_state is not None and state is not None and state.value != last_state):
+            return response
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return response
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 5.0)
+
+
 def create_or_update_pipeline(
     name: str,
     root_path: str,
@@ -547,6 +806,7 @@ def create_or_update_pipeline(
         existing_pipeline_id = find_pipeline_by_name(name)
 
     created = existing_pipeline_id is None
+    action = "created" if created else "updated"
 
     # Step 2: Create or update
     try:
@@ -562,13 +822,15 @@ def create_or_update_pipeline(
             pipeline_id = response.pipeline_id
         else:
             pipeline_id = existing_pipeline_id
+            # Empty values mean "unchanged" here; passed through they would
+            # blank the setting (and [] would remove every source library)
             update_pipeline(
                 pipeline_id=pipeline_id,
-                name=name,
-                root_path=root_path,
-                catalog=catalog,
-                schema=schema,
-                workspace_file_paths=workspace_file_paths,
+                name=name or None,
+                root_path=root_path or None,
+                catalog=catalog or None,
+                schema=schema or None,
+                workspace_file_paths=workspace_file_paths or None,
                 extra_settings=extra_settings,
             )
     except Exception as e:
@@ -594,7 +856,7 @@ def create_or_update_pipeline(
         root_path=root_path,
         created=created,
         success=True,
-        message=f"Pipeline {'created' if created else 'updated'} successfully. Target: {catalog}.{schema}",
+        message=f"Pipeline {action} successfully. Target: {catalog}.{schema}",
     )
 
     # Step 3: Start run if requested
@@ -605,10 +867,10 @@ def create_or_update_pipeline(
                 full_refresh=full_refresh,
             )
             result.update_id = update_id
-            result.message = f"Pipeline {'created' if created else 'updated'} and run started. Update ID: {update_id}"
+            result.message = f"Pipeline {action} and run started. Update ID: {update_id}"
         except Exception as e:
             result.success = False
-            result.error_message = f"Pipeline created but failed to start run: {e}"
+            result.error_message = f"Pipeline {action} but failed to start run: {e}"
             result.message = result.error_message
             return result
 
@@ -626,8 +888,7 @@ def create_or_update_pipeline(
 
                 if result.success:
                     result.message = (
-                        f"Pipeline {'created' if created else 'updated'} and "
-                        f"completed successfully in {result.duration_seconds}s. "
+                        f"Pipeline {action} and completed successfully in {result.duration_seconds}s. "
                         f"Tables written to {catalog}.{schema}"
                     )
                 else:
@@ -644,7 +905,7 @@ def create_or_update_pipeline(
                         result.error_message = f"Pipeline failed with state: {result.state}"
 
                     result.message = (
-                        f"Pipeline {'created' if created else 'updated'} but run failed. "
+                        f"Pipeline {action} but run failed. "
                         f"State: {result.state}. "
                         f"Error: {result.error_message}. "
                         f"Use get_pipeline_events(pipeline_id='{pipeline_id}') for full details."
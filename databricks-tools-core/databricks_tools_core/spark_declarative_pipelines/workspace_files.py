@@ -5,16 +5,63 @@ Functions for managing workspace files and directories for SDP pipelines.
 """
 
 import base64
+import hashlib
 from typing import List
 from databricks.sdk.service.workspace import ObjectInfo, Language, ImportFormat, ExportFormat
 
 from ..auth import get_workspace_client
+from ..common import TTLCache
+
+# Language string to enum mapping
+_LANGUAGE_MAP = {
+    "PYTHON": Language.PYTHON,
+    "SQL": Language.SQL,
+    "SCALA": Language.SCALA,
+    "R": Language.R,
+}
+
+# Short-lived cache for get_file_status, keyed by (path, client). Writes and
+# deletes made through this module drop the affected paths immediately.
+_STATUS_CACHE_TTL_SECONDS = 5.0
+_status_cache = TTLCache(ttl=_STATUS_CACHE_TTL_SECONDS)
+
+
+# Hash of the content last written to each path, with the object's
+# (object_id, modified_at) right after that write, keyed by (path, client).
+# Rewriting identical content to an object nobody touched since is skipped.
+_WRITTEN_HASH_TTL_SECONDS = 3600.0
+_written_hashes = TTLCache(ttl=_WRITTEN_HASH_TTL_SECONDS, maxsize=1024)
+
+
+def _invalidate_status(path: str) -> None:
+    """Drop cached status (and written-content hashes) for a path and everything beneath it."""
+    prefix = path.rstrip("/") + "/"
+
+    def _matches(key) -> bool:
+        return key[0] == path or key[0].startswith(prefix)
+
+    _status_cache.invalidate_if(_matches)
+    _written_hashes.invalidate_if(_matches)
+
+
+def _content_hash(content: str, language: str) -> str:
+    """Hash file content together with its language."""
+    return hashlib.sha256(f"{language}\0{content}".encode("utf-8")).hexdigest()
+
+
+def _object_version(w, path: str) -> tuple:
+    """Return (object_id, modified_at) for a path; changes whenever the object is rewritten."""
+    info = w.workspace.get_status(path=path)
+    return (info.object_id, info.modified_at)
 
 
 def list_files(path: str) -> List[ObjectInfo]:
     """
     List files and directories in a workspace path.
 
+    The listing carries the same metadata as get_file_status, so there is no
+    need to call get_file_status for each entry.
+
     Args:
         path: Workspace path to list
 
@@ -24,6 +71,9 @@ def list_files(path: str) -> List[ObjectInfo]:
         - object_type: DIRECTORY, NOTEBOOK, FILE, LIBRARY, or REPO
         - language: For notebooks (PYTHON, SQL, SCALA, R)
         - object_id: Unique identifier
+        - size: File size in bytes (for files)
+        - created_at: Creation timestamp
+        - modified_at: Last modification timestamp
 
     Raises:
         DatabricksError: If API request fails
@@ -36,6 +86,9 @@ def get_file_status(path: str) -> ObjectInfo:
     """
     Get file or directory metadata.
 
+    Results are cached for a few seconds; writes and deletes made through
+    this module are reflected immediately.
+
     Args:
         path: Workspace path
 
@@ -53,7 +106,7 @@ def get_file_status(path: str) -> ObjectInfo:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return w.workspace.get_status(path=path)
+    return _status_cache.get_or_load((path, w), lambda: w.workspace.get_status(path=path))
 
 
 def read_file(path: str) -> str:
@@ -70,35 +123,49 @@ def read_file(path: str) -> str:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    response = w.workspace.export(path=path, format=ExportFormat.SOURCE)
 
-    # SDK returns ExportResponse with .content field (base64 encoded)
-    return base64.b64decode(response.content).decode("utf-8")
+    # Direct download streams the raw source instead of a base64 string inside
+    # a JSON body, avoiding two extra full-size copies for large files
+    with w.workspace.download(path, format=ExportFormat.SOURCE) as f:
+        return f.read().decode("utf-8")
 
 
-def write_file(path: str, content: str, language: str = "PYTHON", overwrite: bool = True) -> None:
+def write_file(path: str, content: str, language: str = "PYTHON", overwrite: bool = True) -> bool:
     """
     Write or update workspace file.
 
+    When overwrite is True and the same content was already written to this
+    path by this process, the write is skipped if the object's status shows
+    it has not been modified since (a status call is far cheaper than an
+    import, and edits made elsewhere are never lost). The content itself is
+    not compared: SOURCE imports become notebooks, whose export differs
+    from what was written.
+
     Args:
         path: Workspace file path
         content: File content as string
         language: PYTHON, SQL, SCALA, or R
         overwrite: If True, replaces existing file
 
+    Returns:
+        True if the file was written, False if it was already up to date
+
     Raises:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
 
-    # Convert language string to enum
-    lang_map = {
-        "PYTHON": Language.PYTHON,
-        "SQL": Language.SQL,
-        "SCALA": Language.SCALA,
-        "R": Language.R,
-    }
-    lang_enum = lang_map.get(language.upper(), Language.PYTHON)
+    lang_enum = _LANGUAGE_MAP.get(language.upper(), Language.PYTHON)
+    content_hash = _content_hash(content, lang_enum.value)
+    hash_key = (path, w)
+
+    written = _written_hashes.get(hash_key)
+    if overwrite and written is not None and written[0] == content_hash:
+        try:
+            if _object_version(w, path) == written[1]:
+                return False
+        except Exception:
+            pass  # Fall through to a normal write
 
     # Base64 encode content
     content_b64 = base64.b64encode(content.encode("utf-8")).decode("utf-8")
@@ -110,6 +177,14 @@ def write_file(path: str, content: str, language: str = "PYTHON", overwrite: boo
         format=ImportFormat.SOURCE,
         overwrite=overwrite,
     )
+    _invalidate_status(path)
+    try:
+        version = _object_version(w, path)
+        if version[1] is not None:
+            _written_hashes.set(hash_key, (content_hash, version))
+    except Exception:
+        pass  # Without a version to compare against, the next write just goes through
+    return True
 
 
 def create_directory(path: str) -> None:
@@ -124,6 +199,7 @@ def create_directory(path: str) -> None:
     """
     w = get_workspace_client()
     w.workspace.mkdirs(path=path)
+    _invalidate_status(path)
 
 
 def delete_path(path: str, recursive: bool = False) -> None:
@@ -139,3 +215,4 @@ def delete_path(path: str, recursive: bool = False) -> None:
     """
     w = get_workspace_client()
     w.workspace.delete(path=path, recursive=recursive)
+    _invalidate_status(path)
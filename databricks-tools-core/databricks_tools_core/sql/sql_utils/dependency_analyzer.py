@@ -10,7 +10,6 @@ from typing import Dict, List, Optional, Set
 
 import sqlglot
 from sqlglot import exp
-from sqlfluff.core import Linter
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +36,10 @@ class SQLDependencyAnalyzer:
         self.dialect = dialect
         self.created_tables: Dict[str, int] = {}  # table_name -> query_index
         self.query_dependencies: Dict[int, Set[str]] = {}  # query_index -> referenced tables
+        # sqlfluff is slow to import and only needed here, so defer it until an
+        # analyzer is actually created rather than at server start-up
+        from sqlfluff.core import Linter
+
         self._linter = Linter(dialect=self.dialect)
 
     def parse_sql_content(self, sql_content: str) -> List[str]:
@@ -26,6 +26,7 @@ from .schemas import (
 # Tables
 from .tables import (
     list_tables,
+    iter_tables,
     get_table,
     create_table,
     delete_table,
@@ -40,6 +41,14 @@ from .volumes import (
     delete_volume,
 )
 
+# Bulk deletes
+from .bulk import (
+    delete_catalogs,
+    delete_schemas,
+    delete_tables,
+    delete_volumes,
+)
+
 # Volume Files
 from .volume_files import (
     VolumeFileInfo,
@@ -166,6 +175,7 @@ __all__ = [
     "delete_schema",
     # Tables
     "list_tables",
+    "iter_tables",
     "get_table",
     "create_table",
     "delete_table",
@@ -175,6 +185,11 @@ __all__ = [
     "create_volume",
     "update_volume",
     "delete_volume",
+    # Bulk deletes
+    "delete_catalogs",
+    "delete_schemas",
+    "delete_tables",
+    "delete_volumes",
     # Volume Files
     "VolumeFileInfo",
     "VolumeUploadResult",
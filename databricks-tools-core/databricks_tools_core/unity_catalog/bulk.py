@@ -0,0 +1,68 @@
+"""
+Unity Catalog - Bulk Operations
+
+Delete several catalogs, schemas, tables or volumes in one call. The
+individual API calls are issued concurrently, so cleaning up N objects takes
+roughly as long as the slowest single delete rather than the sum of all.
+"""
+
+from typing import List
+
+from ..common import BulkResult, run_bulk
+from .catalogs import delete_catalog
+from .schemas import delete_schema
+from .tables import delete_table
+from .volumes import delete_volume
+
+
+def delete_catalogs(catalog_names: List[str], force: bool = False) -> List[BulkResult]:
+    """
+    Delete several catalogs concurrently.
+
+    Args:
+        catalog_names: Names of the catalogs to delete
+        force: If True, force deletion even if catalogs contain schemas
+
+    Returns:
+        List of BulkResult keyed by name, in input order (duplicates removed)
+    """
+    return run_bulk(lambda name: delete_catalog(catalog_name=name, force=force), catalog_names)
+
+
+def delete_schemas(full_schema_names: List[str]) -> List[BulkResult]:
+    """
+    Delete several schemas concurrently.
+
+    Args:
+        full_schema_names: Full schema names (catalog.schema format)
+
+    Returns:
+        List of BulkResult keyed by name, in input order (duplicates removed)
+    """
+    return run_bulk(lambda name: delete_schema(full_schema_name=name), full_schema_names)
+
+
+def delete_tables(full_table_names: List[str]) -> List[BulkResult]:
+    """
+    Delete several tables concurrently.
+
+    Args:
+        full_table_names: Full table names (catalog.schema.table format)
+
+    Returns:
+        List of BulkResult keyed by name, in input order (duplicates removed)
+    """
+    return run_bulk(lambda name: delete_table(full_table_name=name), full_table_names)
+
+
+def delete_volumes(full_volume_names: List[str]) -> List[BulkResult]:
+    """
+    Delete several volumes concurrently.
+
+    Args:
+        full_volume_names: Full volume names (catalog.schema.volume format)
+
+    Returns:
+        List of BulkResult keyed by name, in input order (duplicates removed)
+    """
+    return run_bulk(lambda name: delete_volume(full_volume_name=name), full_volume_names)
@@ -0,0 +1,102 @@
+"""
+Unity Catalog - Metadata Cache
+
+Short-lived in-process cache for catalog/schema/table listings and lookups, so
+an agent that re-lists or re-describes the same objects several times in a row
+hits the API once.
+
+Entries are keyed by ``(kind, client, *names)``, where ``names`` are the
+lowercased catalog/schema/table name parts (Unity Catalog identifiers are
+case-insensitive). Mutations made through this package call ``invalidate``;
+changes made elsewhere (e.g. ``CREATE TABLE`` in SQL) show up once the short
+TTL expires.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Tuple, TypeVar
+
+from ..common import TTLCache
+
+T = TypeVar("T")
+
+_METADATA_CACHE_TTL_SECONDS = 10
+
+# Listing kinds by depth of the objects they list: catalogs, then schemas, then tables
+_LISTING_KINDS = ("catalogs", "schemas", "tables")
+
+_metadata_cache = TTLCache(ttl=_METADATA_CACHE_TTL_SECONDS, maxsize=1024)
+
+
+def _key(kind: str, w: Any, names: Iterable[str]) -> tuple:
+    return (kind, w) + tuple(name.lower() for name in names)
+
+
+@lru_cache(maxsize=1024)
+def split_full_name(full_name: str) -> Tuple[str, ...]:
+    """Split a dotted UC name into lowercased parts, stripping backtick quoting.
+
+    Memoized, since agents tend to describe and mutate the same few objects.
+
+    Raises:
+        ValueError: If ``full_name`` is empty or None
+    """
+    if not full_name:
+        raise ValueError("A full object name (catalog[.schema[.object]]) is required")
+    return tuple(part.strip("`").lower() for part in full_name.split("."))
+
+
+def cached_listing(kind: str, w: Any, loader: Callable[[], Iterable], *names: str) -> List:
+    """Return ``list(loader())``, served from the cache when recently loaded.
+
+    Args:
+        kind: Listing kind ("catalogs", "schemas" or "tables")
+        w: WorkspaceClient the listing is made with (part of the key)
+        loader: Callable returning the SDK iterator to materialize on a miss
+        *names: Parent catalog / schema names scoping the listing
+
+    Returns:
+        A fresh list the caller may mutate freely
+
+    Raises:
+        ValueError: If a parent name is empty or None
+    """
+    params = ("catalog_name", "schema_name")
+    missing = [params[i] for i, name in enumerate(names) if not name]
+    if missing:
+        raise ValueError(f"{' and '.join(missing)} required to list {kind}")
+    return list(_metadata_cache.get_or_load(_key(kind, w, names), lambda: list(loader())))
+
+
+def cached_object(kind: str, w: Any, loader: Callable[[], T], full_name: str) -> T:
+    """Return ``loader()`` for the object ``full_name``, served from the cache when recently loaded.
+
+    Args:
+        kind: Object kind ("catalog", "schema" or "table")
+        w: WorkspaceClient the lookup is made with (part of the key)
+        loader: Callable fetching the SDK object on a miss
+        full_name: Dotted object name (catalog, catalog.schema or catalog.schema.table)
+
+    Returns:
+        The cached SDK object (shared between callers; do not mutate)
+
+    Raises:
+        ValueError: If ``full_name`` is empty or None
+    """
+    return _metadata_cache.get_or_load((kind, w) + split_full_name(full_name), loader)
+
+
+def invalidate(full_name: str) -> None:
+    """Evict cached metadata after ``full_name`` was created, changed or dropped.
+
+    Drops the listing that contains the object, the object itself and
+    everything cached beneath it. Backtick-quoted names are accepted.
+
+    Args:
+        full_name: Dotted object name (catalog, catalog.schema or catalog.schema.table)
+    """
+    names = split_full_name(full_name)
+    depth = len(names)
+    if not 1 <= depth <= len(_LISTING_KINDS):
+        return
+    parent_listing = (_LISTING_KINDS[depth - 1],) + names[:-1]
+    _metadata_cache.invalidate_if(lambda key: key[2 : 2 + depth] == names or (key[0],) + key[2:] == parent_listing)
@@ -8,12 +8,16 @@ from typing import Dict, List, Optional
 from databricks.sdk.service.catalog import CatalogInfo, IsolationMode
 
 from ..auth import get_workspace_client
+from .cache import cached_listing, cached_object, invalidate
 
 
 def list_catalogs() -> List[CatalogInfo]:
     """
     List all catalogs in Unity Catalog.
 
+    Results are cached for a few seconds; catalog mutations made through this
+    package evict the cached listing.
+
     Returns:
         List of CatalogInfo objects with catalog metadata
 
@@ -21,13 +25,15 @@ def list_catalogs() -> List[CatalogInfo]:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return list(w.catalogs.list())
+    return cached_listing("catalogs", w, w.catalogs.list)
 
 
 def get_catalog(catalog_name: str) -> CatalogInfo:
     """
     Get detailed information about a specific catalog.
 
+    Results are cached for a few seconds, like ``list_catalogs``.
+
     Args:
         catalog_name: Name of the catalog
 
@@ -41,7 +47,7 @@ def get_catalog(catalog_name: str) -> CatalogInfo:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return w.catalogs.get(name=catalog_name)
+    return cached_object("catalog", w, lambda: w.catalogs.get(name=catalog_name), catalog_name)
 
 
 def create_catalog(
@@ -73,7 +79,9 @@ def create_catalog(
         kwargs["storage_root"] = storage_root
     if properties is not None:
         kwargs["properties"] = properties
-    return w.catalogs.create(**kwargs)
+    catalog = w.catalogs.create(**kwargs)
+    invalidate(name)
+    return catalog
 
 
 def update_catalog(
@@ -100,7 +108,7 @@ def update_catalog(
         ValueError: If no fields are provided to update
         DatabricksError: If API request fails
     """
-    if not any([new_name, comment, owner, isolation_mode]):
+    if new_name is None and comment is None and owner is None and isolation_mode is None:
         raise ValueError("At least one field must be provided to update")
 
     w = get_workspace_client()
@@ -113,7 +121,9 @@ def update_catalog(
         kwargs["owner"] = owner
     if isolation_mode is not None:
         kwargs["isolation_mode"] = IsolationMode(isolation_mode)
-    return w.catalogs.update(**kwargs)
+    catalog = w.catalogs.update(**kwargs)
+    invalidate(catalog_name)
+    return catalog
 
 
 def delete_catalog(catalog_name: str, force: bool = False) -> None:
@@ -129,3 +139,4 @@ def delete_catalog(catalog_name: str, force: bool = False) -> None:
     """
     w = get_workspace_client()
     w.catalogs.delete(name=catalog_name, force=force)
+    invalidate(catalog_name)
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 from databricks.sdk.service.catalog import ConnectionInfo, ConnectionType
 
 from ..auth import get_workspace_client
+from .cache import invalidate
 
 _IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z0-9_][a-zA-Z0-9_.\-]*$")
 
@@ -177,6 +178,7 @@ def create_foreign_catalog(
         sql += f" COMMENT '{escaped}'"
 
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(catalog_name)
     return {
         "status": "created",
         "catalog_name": catalog_name,
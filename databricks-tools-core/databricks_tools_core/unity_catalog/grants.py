@@ -13,13 +13,9 @@ from databricks.sdk.service.catalog import (
 from ..auth import get_workspace_client
 
 
-def _parse_securable_type(securable_type: str) -> str:
-    """Parse securable type string to the API-expected string value.
-
-    The GrantsAPI methods expect securable_type as a plain string,
-    not a SecurableType enum instance.
-    """
-    valid_types = {
+# Securable types accepted by the GrantsAPI (as plain lowercase strings)
+_VALID_SECURABLE_TYPES = frozenset(
+    {
         "catalog",
         "schema",
         "table",
@@ -31,9 +27,18 @@ def _parse_securable_type(securable_type: str) -> str:
         "share",
         "metastore",
     }
+)
+
+
+def _parse_securable_type(securable_type: str) -> str:
+    """Parse securable type string to the API-expected string value.
+
+    The GrantsAPI methods expect securable_type as a plain string,
+    not a SecurableType enum instance.
+    """
     key = securable_type.lower().replace("-", "_").replace(" ", "_")
-    if key not in valid_types:
-        raise ValueError(f"Invalid securable_type: '{securable_type}'. Valid types: {sorted(valid_types)}")
+    if key not in _VALID_SECURABLE_TYPES:
+        raise ValueError(f"Invalid securable_type: '{securable_type}'. Valid types: {sorted(_VALID_SECURABLE_TYPES)}")
     return key
 
 
@@ -13,6 +13,7 @@ import textwrap
 from typing import Any, Dict, List, Optional
 
 from ..sql.sql import execute_sql
+from .cache import invalidate
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +194,7 @@ def create_metric_view(
         $$""")
 
     execute_sql(sql_query=sql, warehouse_id=warehouse_id)
+    invalidate(full_name)
 
     return {
         "status": "created",
@@ -248,6 +250,7 @@ def alter_metric_view(
         $$""")
 
     execute_sql(sql_query=sql, warehouse_id=warehouse_id)
+    invalidate(full_name)
 
     return {
         "status": "altered",
@@ -276,6 +279,7 @@ def drop_metric_view(
     sql = f"DROP VIEW{exists_clause} {full_name}"
 
     execute_sql(sql_query=sql, warehouse_id=warehouse_id)
+    invalidate(full_name)
 
     return {
         "status": "dropped",
@@ -362,20 +366,21 @@ def query_metric_view(
             select_parts.append(f"MEASURE({measure})")
 
     select_clause = ",\n  ".join(select_parts)
-    sql = f"SELECT\n  {select_clause}\nFROM {full_name}"
+    clauses = [f"SELECT\n  {select_clause}", f"FROM {full_name}"]
 
     if where:
-        sql += f"\nWHERE {where}"
+        clauses.append(f"WHERE {where}")
 
     if dimensions:
-        sql += "\nGROUP BY ALL"
+        clauses.append("GROUP BY ALL")
 
     if order_by:
-        sql += f"\nORDER BY {order_by}"
+        clauses.append(f"ORDER BY {order_by}")
 
     if limit:
-        sql += f"\nLIMIT {limit}"
+        clauses.append(f"LIMIT {limit}")
 
+    sql = "\n".join(clauses)
     return execute_sql(sql_query=sql, warehouse_id=warehouse_id)
 
 
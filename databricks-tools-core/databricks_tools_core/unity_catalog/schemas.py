@@ -8,12 +8,16 @@ from typing import List, Optional
 from databricks.sdk.service.catalog import SchemaInfo
 
 from ..auth import get_workspace_client
+from .cache import cached_listing, cached_object, invalidate
 
 
 def list_schemas(catalog_name: str) -> List[SchemaInfo]:
     """
     List all schemas in a catalog.
 
+    Results are cached for a few seconds; schema mutations made through this
+    package evict the cached listing.
+
     Args:
         catalog_name: Name of the catalog
 
@@ -24,13 +28,15 @@ def list_schemas(catalog_name: str) -> List[SchemaInfo]:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return list(w.schemas.list(catalog_name=catalog_name))
+    return cached_listing("schemas", w, lambda: w.schemas.list(catalog_name=catalog_name), catalog_name)
 
 
 def get_schema(full_schema_name: str) -> SchemaInfo:
     """
     Get detailed information about a specific schema.
 
+    Results are cached for a few seconds, like ``list_schemas``.
+
     Args:
         full_schema_name: Full schema name (catalog.schema format)
 
@@ -44,7 +50,7 @@ def get_schema(full_schema_name: str) -> SchemaInfo:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return w.schemas.get(full_name=full_schema_name)
+    return cached_object("schema", w, lambda: w.schemas.get(full_name=full_schema_name), full_schema_name)
 
 
 def create_schema(catalog_name: str, schema_name: str, comment: Optional[str] = None) -> SchemaInfo:
@@ -63,7 +69,9 @@ def create_schema(catalog_name: str, schema_name: str, comment: Optional[str] =
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return w.schemas.create(name=schema_name, catalog_name=catalog_name, comment=comment)
+    schema = w.schemas.create(name=schema_name, catalog_name=catalog_name, comment=comment)
+    invalidate(f"{catalog_name}.{schema_name}")
+    return schema
 
 
 def update_schema(
@@ -88,11 +96,13 @@ def update_schema(
         ValueError: If no fields are provided to update
         DatabricksError: If API request fails
     """
-    if not any([new_name, comment, owner]):
+    if new_name is None and comment is None and owner is None:
         raise ValueError("At least one field (new_name, comment, or owner) must be provided")
 
     w = get_workspace_client()
-    return w.schemas.update(full_name=full_schema_name, new_name=new_name, comment=comment, owner=owner)
+    schema = w.schemas.update(full_name=full_schema_name, new_name=new_name, comment=comment, owner=owner)
+    invalidate(full_schema_name)
+    return schema
 
 
 def delete_schema(full_schema_name: str) -> None:
@@ -107,3 +117,4 @@ def delete_schema(full_schema_name: str) -> None:
     """
     w = get_workspace_client()
     w.schemas.delete(full_name=full_schema_name)
+    invalidate(full_schema_name)
@@ -8,6 +8,8 @@ All operations are SQL-based via execute_sql.
 import re
 from typing import Any, Dict, List, Optional
 
+from .cache import invalidate
+
 _IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z0-9_][a-zA-Z0-9_.\-]*$")
 
 
@@ -97,6 +99,7 @@ def set_row_filter(
 
     sql = f"ALTER TABLE {table_name} SET ROW FILTER {filter_function} ON ({cols_str})"
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(table_name)
     return {
         "status": "row_filter_set",
         "table": table_name,
@@ -122,6 +125,7 @@ def drop_row_filter(
     _validate_identifier(table_name)
     sql = f"ALTER TABLE {table_name} DROP ROW FILTER"
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(table_name)
     return {"status": "row_filter_dropped", "table": table_name, "sql": sql}
 
 
@@ -151,6 +155,7 @@ def set_column_mask(
 
     sql = f"ALTER TABLE {table_name} ALTER COLUMN `{column_name}` SET MASK {mask_function}"
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(table_name)
     return {
         "status": "column_mask_set",
         "table": table_name,
@@ -181,4 +186,5 @@ def drop_column_mask(
 
     sql = f"ALTER TABLE {table_name} ALTER COLUMN `{column_name}` DROP MASK"
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(table_name)
     return {"status": "column_mask_dropped", "table": table_name, "column": column_name, "sql": sql}
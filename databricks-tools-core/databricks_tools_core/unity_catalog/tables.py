@@ -4,16 +4,21 @@ Unity Catalog - Table Operations
 Functions for managing tables in Unity Catalog.
 """
 
-from typing import List, Optional
+from itertools import islice
+from typing import Iterator, List, Optional
 from databricks.sdk.service.catalog import TableInfo, ColumnInfo, TableType, DataSourceFormat
 
 from ..auth import get_workspace_client
+from .cache import cached_listing, cached_object, invalidate
 
 
 def list_tables(catalog_name: str, schema_name: str) -> List[TableInfo]:
     """
     List all tables in a schema.
 
+    Results are cached for a few seconds; table mutations made through this
+    package evict the cached listing.
+
     Args:
         catalog_name: Name of the catalog
         schema_name: Name of the schema
@@ -25,13 +30,53 @@ def list_tables(catalog_name: str, schema_name: str) -> List[TableInfo]:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return list(w.tables.list(catalog_name=catalog_name, schema_name=schema_name))
+    return cached_listing(
+        "tables",
+        w,
+        lambda: w.tables.list(catalog_name=catalog_name, schema_name=schema_name),
+        catalog_name,
+        schema_name,
+    )
+
+
+def iter_tables(
+    catalog_name: str,
+    schema_name: str,
+    max_results: Optional[int] = None,
+    omit_columns: bool = False,
+) -> Iterator[TableInfo]:
+    """
+    Iterate over the tables in a schema, fetching pages lazily.
+
+    Unlike ``list_tables`` this is not cached and never holds the whole
+    listing in memory, which suits schemas with thousands of tables.
+
+    Args:
+        catalog_name: Name of the catalog
+        schema_name: Name of the schema
+        max_results: Stop after this many tables (default: all)
+        omit_columns: If True, skip column definitions to shrink each page
+
+    Returns:
+        Iterator of TableInfo objects
+
+    Raises:
+        DatabricksError: If API request fails
+    """
+    w = get_workspace_client()
+    kwargs = {"omit_columns": True} if omit_columns else {}
+    if max_results is not None:
+        kwargs["max_results"] = max_results
+    table_iter = w.tables.list(catalog_name=catalog_name, schema_name=schema_name, **kwargs)
+    return table_iter if max_results is None else islice(table_iter, max_results)
 
 
 def get_table(full_table_name: str) -> TableInfo:
     """
     Get detailed information about a specific table.
 
+    Results are cached for a few seconds, like ``list_tables``.
+
     Args:
         full_table_name: Full table name (catalog.schema.table format)
 
@@ -46,7 +91,7 @@ def get_table(full_table_name: str) -> TableInfo:
         DatabricksError: If API request fails
     """
     w = get_workspace_client()
-    return w.tables.get(full_name=full_table_name)
+    return cached_object("table", w, lambda: w.tables.get(full_name=full_table_name), full_table_name)
 
 
 def create_table(
@@ -114,6 +159,7 @@ def create_table(
         except Exception:
             pass  # Ignore comment update failures
 
+    invalidate(full_name)
     return table
 
 
@@ -129,3 +175,4 @@ def delete_table(full_table_name: str) -> None:
     """
     w = get_workspace_client()
     w.tables.delete(full_name=full_table_name)
+    invalidate(full_table_name)
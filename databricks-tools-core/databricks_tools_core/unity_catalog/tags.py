@@ -8,6 +8,8 @@ All operations are SQL-based via execute_sql.
 import re
 from typing import Any, Dict, List, Optional
 
+from .cache import invalidate
+
 _IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z0-9_][a-zA-Z0-9_.\-]*$")
 
 
@@ -63,6 +65,7 @@ def set_tags(
         sql = f"ALTER {obj_keyword} {full_name} SET TAGS ({tag_pairs})"
 
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(full_name)
     return {"status": "tags_set", "object": full_name, "tags": tags, "sql": sql}
 
 
@@ -101,6 +104,7 @@ def unset_tags(
         sql = f"ALTER {obj_keyword} {full_name} UNSET TAGS ({tag_keys})"
 
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(full_name)
     return {"status": "tags_unset", "object": full_name, "tag_names": tag_names, "sql": sql}
 
 
@@ -139,6 +143,7 @@ def set_comment(
         sql = f"COMMENT ON {obj_keyword} {full_name} IS '{escaped_comment}'"
 
     _execute_uc_sql(sql, warehouse_id=warehouse_id)
+    invalidate(full_name)
     return {"status": "comment_set", "object": full_name, "sql": sql}
 
 
@@ -120,7 +120,7 @@ def update_volume(
         ValueError: If no fields are provided to update
         DatabricksError: If API request fails
     """
-    if not any([new_name, comment, owner]):
+    if new_name is None and comment is None and owner is None:
         raise ValueError("At least one field must be provided to update")
 
     w = get_workspace_client()
@@ -0,0 +1,53 @@
+"""
+Shared fixtures for databricks-tools-core unit tests.
+
+Unit tests never touch a workspace: SDK calls go to a MagicMock client that
+is patched into the modules under test.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_workspace(monkeypatch):
+    """
+    Factory that patches a MagicMock WorkspaceClient into modules.
+
+    Call it with the modules whose ``get_workspace_client`` should return the
+    mock and the module-level caches to empty before and after the test.
+    Caches only need a ``clear()`` method (TTLCache, dict, set).
+    """
+    caches_to_clear = []
+
+    def _patch(modules, caches=()):
+        w = MagicMock()
+        for module in modules:
+            monkeypatch.setattr(module, "get_workspace_client", lambda: w)
+        for c in caches:
+            c.clear()
+        caches_to_clear.extend(caches)
+        return w
+
+    yield _patch
+    for c in caches_to_clear:
+        c.clear()
+
+
+@pytest.fixture
+def paginated():
+    """
+    Side effect for SDK list calls that lazily yields 0, 1, 2, ... (up to 1000).
+
+    Returns ``(side_effect, pulled)``; ``pulled`` records every item the code
+    under test actually consumed, to check it stops paging early.
+    """
+    pulled = []
+
+    def _paginate(**kwargs):
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+
+    return _paginate, pulled
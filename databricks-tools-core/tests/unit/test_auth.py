@@ -0,0 +1,78 @@
+"""Unit tests for WorkspaceClient caching in auth.py (no Databricks connection needed)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from databricks_tools_core import auth
+
+
+@pytest.fixture(autouse=True)
+def fake_clients(monkeypatch):
+    """Replace client construction with a factory returning fresh mocks."""
+    for var in ("DATABRICKS_CLIENT_ID", "DATABRICKS_CLIENT_SECRET", "DATABRICKS_HOST", "DATABRICKS_TOKEN"):
+        monkeypatch.delenv(var, raising=False)
+    factory = MagicMock(side_effect=lambda host, token: MagicMock(name=f"client({host})"))
+    monkeypatch.setattr(auth, "_create_workspace_client", factory)
+    auth._client_cache.clear()
+    yield factory
+    auth._client_cache.clear()
+    auth.clear_databricks_auth()
+
+
+def test_client_is_reused_for_same_credentials(fake_clients):
+    first = auth.get_workspace_client()
+    second = auth.get_workspace_client()
+
+    assert first is second
+    assert fake_clients.call_count == 1
+
+
+def test_client_is_keyed_by_context_credentials(fake_clients):
+    auth.set_databricks_auth("https://a.cloud.databricks.com", "token-a")
+    client_a = auth.get_workspace_client()
+    auth.set_databricks_auth("https://b.cloud.databricks.com", "token-b")
+    client_b = auth.get_workspace_client()
+    auth.set_databricks_auth("https://a.cloud.databricks.com", "token-a")
+
+    assert client_a is not client_b
+    assert auth.get_workspace_client() is client_a
+    assert fake_clients.call_count == 2
+
+
+def test_cache_is_bounded(fake_clients, monkeypatch):
+    monkeypatch.setattr(auth, "_MAX_CACHED_CLIENTS", 2)
+    for i in range(3):
+        auth.set_databricks_auth("https://host", f"token-{i}")
+        auth.get_workspace_client()
+
+    assert len(auth._client_cache) == 2
+
+
+def test_slow_client_build_does_not_block_other_credentials(fake_clients):
+    import threading
+
+    auth.set_databricks_auth("https://fast", "token")
+    fast_client = auth.get_workspace_client()
+
+    building, release = threading.Event(), threading.Event()
+
+    def _slow_build(host, token):
+        building.set()
+        release.wait(5)
+        return MagicMock(name="slow")
+
+    fake_clients.side_effect = _slow_build
+
+    def _slow_caller():
+        auth.set_databricks_auth("https://slow", "token")
+        auth.get_workspace_client()
+
+    slow = threading.Thread(target=_slow_caller)
+    slow.start()
+    assert building.wait(5)
+    try:
+        assert auth.get_workspace_client() is fast_client
+    finally:
+        release.set()
+        slow.join(5)
@@ -0,0 +1,71 @@
+"""Unit tests for the in-process TTLCache."""
+
+import threading
+import time
+
+import pytest
+
+from databricks_tools_core.common import TTLCache
+
+
+def test_returns_cached_value_until_expiry():
+    cache = TTLCache(ttl=0.05)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_load("k", load) == 1
+    assert cache.get_or_load("k", load) == 1
+    time.sleep(0.06)
+    assert cache.get_or_load("k", load) == 2
+
+
+def test_concurrent_loads_are_coalesced():
+    cache = TTLCache(ttl=10)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_load))) for _ in range(5)]
+    threads[0].start()
+    started.wait(timeout=5)
+    for t in threads[1:]:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_errors_are_not_cached():
+    cache = TTLCache(ttl=10)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", fail)
+    assert cache.get_or_load("k", lambda: "ok") == "ok"
+
+
+def test_invalidate_if_and_maxsize():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.get_or_load(("a", 1), lambda: 1)
+    cache.get_or_load(("b", 2), lambda: 2)
+    cache.invalidate_if(lambda key: key[0] == "a")
+    assert cache.get_or_load(("a", 1), lambda: "reloaded") == "reloaded"
+
+    cache.get_or_load(("c", 3), lambda: 3)
+    assert cache.get_or_load(("b", 2), lambda: "evicted") == "evicted"
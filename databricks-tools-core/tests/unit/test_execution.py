@@ -0,0 +1,103 @@
+"""Unit tests for compute.execution (SDK calls mocked)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from databricks_tools_core.compute import execution
+
+
+@pytest.mark.parametrize(
+    "state, expected",
+    [
+        ("RUNNING", "Cluster 'demo' is running and ready for use."),
+        ("RESIZING", "Cluster 'demo' is resizing. Please wait and check again in 30-60 seconds."),
+        ("TERMINATED", "Cluster 'demo' is terminated."),
+        ("UNKNOWN", "Cluster 'demo' is in state: UNKNOWN."),
+    ],
+)
+def test_get_cluster_status_message(monkeypatch, state, expected):
+    w = MagicMock()
+    w.clusters.get.return_value.cluster_name = "demo"
+    w.clusters.get.return_value.state.value = state
+    monkeypatch.setattr(execution, "get_workspace_client", lambda: w)
+
+    assert execution.get_cluster_status("c-1")["message"] == expected
+
+
+@pytest.fixture
+def workspace(mock_workspace):
+    w = mock_workspace(
+        [execution], caches=[execution._idle_contexts, execution._checked_out_contexts, execution._claimed_contexts]
+    )
+    w.command_execution.create.return_value.result.return_value.id = "ctx-1"
+    w.command_execution.execute.return_value.result.return_value.status = execution.CommandStatus.FINISHED
+    w.command_execution.execute.return_value.result.return_value.results = None
+    w.command_execution.context_status.return_value.status = execution.ContextStatus.RUNNING
+    return w
+
+
+def test_execute_reuses_idle_auto_created_context(workspace):
+    first = execution.execute_databricks_command("1", cluster_id="c-1")
+    second = execution.execute_databricks_command("2", cluster_id="c-1")
+
+    assert first.context_id == second.context_id == "ctx-1"
+    workspace.command_execution.create.assert_called_once()
+
+
+def test_execute_skips_dead_or_destroyed_contexts(workspace):
+    execution.execute_databricks_command("1", cluster_id="c-1", destroy_context_on_completion=True)
+    execution.execute_databricks_command("2", cluster_id="c-1")
+    workspace.command_execution.context_status.return_value.status = execution.ContextStatus.ERROR
+    execution.execute_databricks_command("3", cluster_id="c-1")
+
+    assert workspace.command_execution.create.call_count == 3
+
+
+def test_explicit_context_is_claimed_out_of_the_pool(workspace):
+    first = execution.execute_databricks_command("1", cluster_id="c-1")
+    assert "shared pool" in first.message
+
+    workspace.command_execution.create.return_value.result.return_value.id = "ctx-2"
+    mine = execution.execute_databricks_command("2", cluster_id="c-1", context_id="ctx-1")
+    other = execution.execute_databricks_command("3", cluster_id="c-1")
+
+    assert mine.context_id == "ctx-1"
+    assert other.context_id == "ctx-2"
+
+
+def test_pooled_context_claimed_mid_run_is_not_checked_back_in(workspace):
+    def _execute(cluster_id, context_id, **kwargs):
+        execution._claim_context(context_id)  # an explicit caller takes it meanwhile
+        return MagicMock(**{"result.return_value.status": execution.CommandStatus.FINISHED})
+
+    execution.execute_databricks_command("1", cluster_id="c-1")
+    workspace.command_execution.execute.side_effect = _execute
+    result = execution.execute_databricks_command("2", cluster_id="c-1")
+
+    assert result.context_id == "ctx-1"
+    assert "shared pool" not in result.message
+    assert execution._idle_contexts == {}
+    assert execution._claimed_contexts == set()
+
+
+def test_timed_out_context_is_not_returned_to_the_pool(workspace):
+    workspace.command_execution.execute.return_value.result.side_effect = TimeoutError()
+
+    timed_out = execution.execute_databricks_command("1", cluster_id="c-1")
+    workspace.command_execution.create.return_value.result.return_value.id = "ctx-2"
+    workspace.command_execution.execute.return_value.result.side_effect = None
+    nxt = execution.execute_databricks_command("2", cluster_id="c-1")
+
+    assert timed_out.error == "Command timed out"
+    assert nxt.context_id == "ctx-2"
+
+
+def test_pooled_context_is_released_when_execution_raises(workspace):
+    workspace.command_execution.execute.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        execution.execute_databricks_command("1", cluster_id="c-1")
+
+    assert execution._idle_contexts == {}
+    assert execution._checked_out_contexts == set()
@@ -0,0 +1,212 @@
+"""Unit tests for spark_declarative_pipelines.pipelines (SDK calls mocked)."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from databricks_tools_core.spark_declarative_pipelines import pipelines
+
+
+@pytest.fixture
+def workspace(mock_workspace):
+    return mock_workspace([pipelines], caches=[pipelines._poll_cache, pipelines._validation_cache])
+
+
+def _update_responses(*states):
+    """Side effect for get_update returning one response per state, in order."""
+    states = iter(states)
+
+    def _get_update(**kwargs):
+        response = MagicMock()
+        response.update.state = next(states)
+        return response
+
+    return _get_update
+
+
+def test_get_pipeline_events_stops_after_max_results(workspace, paginated):
+    workspace.pipelines.list_pipeline_events.side_effect, pulled = paginated
+
+    events = pipelines.get_pipeline_events("pipe-1", max_results=5)
+
+    assert events == [0, 1, 2, 3, 4]
+    assert len(pulled) == 5
+
+
+def test_get_pipeline_events_passes_filter_only_when_set(workspace):
+    pipelines.get_pipeline_events("pipe-1", max_results=10, filter="level='ERROR'")
+    pipelines.get_pipeline_events("pipe-1", max_results=10)
+
+    calls = workspace.pipelines.list_pipeline_events.call_args_list
+    assert calls[0].kwargs == {"pipeline_id": "pipe-1", "max_results": 10, "filter": "level='ERROR'"}
+    assert calls[1].kwargs == {"pipeline_id": "pipe-1", "max_results": 10}
+
+
+def test_get_update_reuses_recent_result(workspace):
+    first = pipelines.get_update("pipe-1", "upd-1")
+    second = pipelines.get_update("pipe-1", "upd-1")
+
+    assert first is second
+    workspace.pipelines.get_update.assert_called_once_with(pipeline_id="pipe-1", update_id="upd-1")
+
+
+def test_mutations_invalidate_cached_reads(workspace):
+    pipelines.get_pipeline("pipe-1")
+    pipelines.stop_pipeline("pipe-1")
+    pipelines.get_pipeline("pipe-1")
+
+    assert workspace.pipelines.get.call_count == 2
+
+
+def test_validate_only_reuses_in_progress_dry_run(workspace):
+    workspace.pipelines.start_update.side_effect = [MagicMock(update_id="upd-1"), MagicMock(update_id="upd-2")]
+    workspace.pipelines.get_update.return_value.update.state = pipelines.UpdateInfoState.RUNNING
+
+    assert pipelines.start_update("pipe-1", validate_only=True) == "upd-1"
+    assert pipelines.start_update("pipe-1", validate_only=True, reuse_running_validation=True) == "upd-1"
+    workspace.pipelines.start_update.assert_called_once_with(pipeline_id="pipe-1", validate_only=True)
+
+    pipelines._poll_cache.clear()
+    workspace.pipelines.get_update.return_value.update.state = pipelines.UpdateInfoState.COMPLETED
+    assert pipelines.start_update("pipe-1", validate_only=True, reuse_running_validation=True) == "upd-2"
+
+
+def test_validate_only_starts_fresh_when_earlier_dry_run_is_unavailable(workspace):
+    workspace.pipelines.start_update.side_effect = [MagicMock(update_id="upd-1"), MagicMock(update_id="upd-2")]
+    workspace.pipelines.get_update.side_effect = RuntimeError("update not found")
+
+    assert pipelines.start_update("pipe-1", validate_only=True) == "upd-1"
+    assert pipelines.start_update("pipe-1", validate_only=True, reuse_running_validation=True) == "upd-2"
+
+
+def test_validate_only_does_not_reuse_by_default(workspace):
+    workspace.pipelines.start_update.side_effect = [MagicMock(update_id="upd-1"), MagicMock(update_id="upd-2")]
+    workspace.pipelines.get_update.return_value.update.state = pipelines.UpdateInfoState.RUNNING
+
+    pipelines.start_update("pipe-1", validate_only=True)
+    assert pipelines.find_running_validation("pipe-1") == "upd-1"
+    assert pipelines.start_update("pipe-1", validate_only=True) == "upd-2"
+
+
+def test_create_pipeline_explicit_params_override_extra_settings(workspace):
+    pipelines.create_pipeline(
+        name="p",
+        root_path="/Workspace/root",
+        catalog="main",
+        schema="sdp",
+        workspace_file_paths=["/Workspace/root/a.sql"],
+        extra_settings={"id": "old-id", "name": "ignored", "libraries": [{"notebook": {"path": "/x"}}]},
+    )
+
+    kwargs = workspace.pipelines.create.call_args.kwargs
+    assert "id" not in kwargs
+    assert kwargs["name"] == "p"
+    assert [lib.file.path for lib in kwargs["libraries"]] == ["/Workspace/root/a.sql"]
+
+
+def test_update_pipeline_only_sends_provided_fields(workspace):
+    pipelines.update_pipeline("pipe-1", name="renamed", workspace_file_paths=[])
+
+    kwargs = workspace.pipelines.update.call_args.kwargs
+    assert kwargs == {"pipeline_id": "pipe-1", "name": "renamed", "libraries": []}
+
+
+def test_create_or_update_keeps_existing_settings_for_empty_values(workspace, monkeypatch):
+    monkeypatch.setattr(pipelines, "find_pipeline_by_name", lambda name: "pipe-1")
+
+    result = pipelines.create_or_update_pipeline(
+        name="n", root_path="", catalog="", schema="s", workspace_file_paths=[]
+    )
+
+    assert result.success
+    kwargs = workspace.pipelines.update.call_args.kwargs
+    assert kwargs == {"pipeline_id": "pipe-1", "name": "n", "schema": "s"}
+
+
+def test_get_updates_async_preserves_order(workspace):
+    workspace.pipelines.get_update.side_effect = lambda pipeline_id, update_id: (pipeline_id, update_id)
+
+    results = asyncio.run(pipelines.get_updates_async([("p1", "u1"), ("p2", "u2"), ("p1", "u3")]))
+
+    assert results == [("p1", "u1"), ("p2", "u2"), ("p1", "u3")]
+
+
+def test_delete_pipelines_reports_per_pipeline_results(workspace):
+    def _delete(pipeline_id):
+        if pipeline_id == "bad":
+            raise RuntimeError("not found")
+
+    workspace.pipelines.delete.side_effect = _delete
+
+    results = pipelines.delete_pipelines(["p1", "bad", "p2", "p1"])
+
+    assert [(r.key, r.success, r.error) for r in results] == [
+        ("p1", True, None),
+        ("bad", False, "not found"),
+        ("p2", True, None),
+    ]
+
+
+def test_bulk_calls_keep_request_auth_context(monkeypatch):
+    from databricks_tools_core import auth
+
+    seen = []
+    monkeypatch.setattr(pipelines, "get_pipeline", lambda pid: seen.append(auth._host_ctx.get()))
+
+    auth.set_databricks_auth("https://example.cloud.databricks.com", "token")
+    try:
+        pipelines.get_pipelines(["p1", "p2"])
+    finally:
+        auth.clear_databricks_auth()
+
+    assert seen == ["https://example.cloud.databricks.com"] * 2
+
+
+def test_wait_for_update_change_returns_on_transition(workspace, monkeypatch):
+    workspace.pipelines.get_update.side_effect = _update_responses(
+        pipelines.UpdateInfoState.RUNNING, pipelines.UpdateInfoState.RUNNING, pipelines.UpdateInfoState.FAILED
+    )
+    sleeps = []
+    monkeypatch.setattr(pipelines.time, "sleep", sleeps.append)
+    monkeypatch.setattr(pipelines._poll_cache, "ttl", 0)
+
+    result = pipelines.wait_for_update_change("pipe-1", "upd-1", last_state="RUNNING", timeout=60)
+
+    assert result.update.state == pipelines.UpdateInfoState.FAILED
+    assert sleeps == [1.0, 2.0]
+
+
+def test_wait_for_update_change_last_state_is_case_insensitive(workspace, monkeypatch):
+    workspace.pipelines.get_update.side_effect = _update_responses(
+        pipelines.UpdateInfoState.RUNNING, pipelines.UpdateInfoState.COMPLETED
+    )
+    sleeps = []
+    monkeypatch.setattr(pipelines.time, "sleep", sleeps.append)
+    monkeypatch.setattr(pipelines._poll_cache, "ttl", 0)
+
+    result = pipelines.wait_for_update_change("pipe-1", "upd-1", last_state="running", timeout=60)
+
+    assert result.update.state == pipelines.UpdateInfoState.COMPLETED
+    assert sleeps == [1.0]
+
+
+def test_wait_for_update_change_returns_latest_response_on_timeout(workspace, monkeypatch):
+    workspace.pipelines.get_update.return_value.update.state = pipelines.UpdateInfoState.RUNNING
+    clock = [0.0]
+    sleeps = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(pipelines.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(pipelines.time, "sleep", _sleep)
+    monkeypatch.setattr(pipelines._poll_cache, "ttl", 0)
+
+    result = pipelines.wait_for_update_change("pipe-1", "upd-1", last_state="RUNNING", timeout=12)
+
+    assert result.update.state == pipelines.UpdateInfoState.RUNNING
+    # Backoff doubles up to the 5s cap, and the last sleep is trimmed to the deadline
+    assert sleeps == [1.0, 2.0, 4.0, 5.0]
+    assert workspace.pipelines.get_update.call_count == 5
@@ -0,0 +1,152 @@
+"""Unit tests for unity_catalog metadata caching and bulk deletes (SDK calls mocked)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from databricks_tools_core.unity_catalog import cache, catalogs, schemas, tables
+
+
+@pytest.fixture
+def workspace(mock_workspace):
+    return mock_workspace([catalogs, schemas, tables], caches=[cache._metadata_cache])
+
+
+def test_repeated_listing_hits_api_once(workspace):
+    workspace.tables.list.return_value = iter(["t1", "t2"])
+
+    first = tables.list_tables("main", "sales")
+    first.append("mutated")
+    second = tables.list_tables("MAIN", "Sales")
+
+    assert second == ["t1", "t2"]
+    workspace.tables.list.assert_called_once()
+
+
+def test_table_mutations_evict_only_that_schema(workspace):
+    workspace.tables.list.side_effect = lambda **kwargs: iter([kwargs["schema_name"]])
+    tables.list_tables("main", "sales")
+    tables.list_tables("main", "hr")
+
+    tables.delete_table("main.sales.orders")
+    tables.list_tables("main", "sales")
+    tables.list_tables("main", "hr")
+
+    assert workspace.tables.list.call_count == 3
+
+
+def test_schema_mutations_evict_schema_and_table_listings(workspace):
+    workspace.schemas.list.return_value = []
+    workspace.tables.list.return_value = []
+    schemas.list_schemas("main")
+    tables.list_tables("main", "sales")
+
+    schemas.delete_schema("main.sales")
+    schemas.list_schemas("main")
+    tables.list_tables("main", "sales")
+
+    assert workspace.schemas.list.call_count == 2
+    assert workspace.tables.list.call_count == 2
+
+
+def test_catalog_delete_evicts_everything_under_it(workspace):
+    workspace.catalogs.list.return_value = []
+    workspace.schemas.list.return_value = []
+    catalogs.list_catalogs()
+    schemas.list_schemas("main")
+    schemas.list_schemas("other")
+
+    catalogs.delete_catalog("main", force=True)
+    catalogs.list_catalogs()
+    schemas.list_schemas("main")
+    schemas.list_schemas("other")
+
+    assert workspace.catalogs.list.call_count == 2
+    assert workspace.schemas.list.call_count == 3
+
+
+def test_listings_are_scoped_per_client(monkeypatch):
+    cache._metadata_cache.clear()
+    clients = [MagicMock(), MagicMock()]
+    for w in clients:
+        w.catalogs.list.return_value = []
+    for w in clients:
+        monkeypatch.setattr(catalogs, "get_workspace_client", lambda w=w: w)
+        catalogs.list_catalogs()
+
+    assert all(w.catalogs.list.call_count == 1 for w in clients)
+
+
+def test_get_table_is_cached_until_table_changes(workspace, monkeypatch):
+    from databricks_tools_core.unity_catalog import security_policies
+
+    monkeypatch.setattr(security_policies, "_execute_uc_sql", lambda sql, warehouse_id=None: [])
+    workspace.tables.get.side_effect = lambda full_name: full_name
+
+    assert tables.get_table("main.sales.orders") == "main.sales.orders"
+    tables.get_table("Main.Sales.Orders")
+    tables.get_table("main.sales.customers")
+    assert workspace.tables.get.call_count == 2
+
+    security_policies.drop_row_filter("main.sales.orders")
+    tables.get_table("main.sales.orders")
+    tables.get_table("main.sales.customers")
+    assert workspace.tables.get.call_count == 3
+
+
+def test_invalidate_accepts_backtick_quoted_names(workspace):
+    workspace.schemas.get.return_value = "info"
+    workspace.schemas.list.return_value = []
+    schemas.get_schema("main.sales")
+    schemas.list_schemas("main")
+
+    cache.invalidate("`main`.`sales`")
+    schemas.get_schema("main.sales")
+    schemas.list_schemas("main")
+
+    assert workspace.schemas.get.call_count == 2
+    assert workspace.schemas.list.call_count == 2
+
+
+def test_missing_full_name_raises_value_error(workspace):
+    with pytest.raises(ValueError, match="full object name"):
+        tables.get_table(None)
+    workspace.tables.get.assert_not_called()
+
+
+def test_bulk_delete_reports_each_object(workspace):
+    from databricks_tools_core.unity_catalog import bulk
+
+    def _delete(full_name):
+        if full_name == "main.sales.bad":
+            raise RuntimeError("not found")
+
+    workspace.tables.delete.side_effect = _delete
+
+    results = bulk.delete_tables(["main.sales.a", "main.sales.bad", "main.sales.a", "main.sales.b"])
+
+    assert [(r.key, r.success) for r in results] == [
+        ("main.sales.a", True),
+        ("main.sales.bad", False),
+        ("main.sales.b", True),
+    ]
+    assert results[1].error == "not found"
+    assert workspace.tables.delete.call_count == 3
+
+
+def test_iter_tables_stops_after_max_results(workspace, paginated):
+    workspace.tables.list.side_effect, pulled = paginated
+
+    assert list(tables.iter_tables("main", "sales", max_results=3, omit_columns=True)) == [0, 1, 2]
+    assert len(pulled) == 3
+    kwargs = workspace.tables.list.call_args.kwargs
+    assert kwargs["omit_columns"] is True and kwargs["max_results"] == 3
+
+
+def test_listing_without_scope_names_raises_value_error(workspace):
+    with pytest.raises(ValueError, match="catalog_name required to list schemas"):
+        schemas.list_schemas(None)
+    with pytest.raises(ValueError, match="schema_name required to list tables"):
+        tables.list_tables("main", None)
+    workspace.schemas.list.assert_not_called()
+    workspace.tables.list.assert_not_called()
@@ -0,0 +1,65 @@
+"""Unit tests for spark_declarative_pipelines.workspace_files (SDK calls mocked)."""
+
+import io
+
+import pytest
+from databricks.sdk.service.workspace import ObjectInfo
+
+from databricks_tools_core.spark_declarative_pipelines import workspace_files
+
+
+@pytest.fixture
+def workspace(mock_workspace):
+    return mock_workspace([workspace_files], caches=[workspace_files._status_cache, workspace_files._written_hashes])
+
+
+def test_get_file_status_reuses_recent_result(workspace):
+    workspace_files.get_file_status("/Workspace/p/a.sql")
+    workspace_files.get_file_status("/Workspace/p/a.sql")
+
+    workspace.workspace.get_status.assert_called_once_with(path="/Workspace/p/a.sql")
+
+
+def test_delete_invalidates_path_and_descendants(workspace):
+    workspace_files.get_file_status("/Workspace/p/a.sql")
+    workspace_files.get_file_status("/Workspace/pp/b.sql")
+    workspace_files.delete_path("/Workspace/p", recursive=True)
+    workspace_files.get_file_status("/Workspace/p/a.sql")
+    workspace_files.get_file_status("/Workspace/pp/b.sql")
+
+    assert workspace.workspace.get_status.call_count == 3
+
+
+def test_read_file_uses_direct_download(workspace):
+    workspace.workspace.download.return_value = io.BytesIO("SELECT 'é'".encode("utf-8"))
+
+    assert workspace_files.read_file("/Workspace/p/a.sql") == "SELECT 'é'"
+    workspace.workspace.export.assert_not_called()
+
+
+def _status(object_id, modified_at):
+    return ObjectInfo(path="/Workspace/p/a.sql", object_id=object_id, modified_at=modified_at)
+
+
+def test_write_file_skips_unchanged_content(workspace):
+    # SOURCE imports become notebooks, so an export never echoes the written content
+    workspace.workspace.download.side_effect = lambda *a, **k: io.BytesIO(b"-- Databricks notebook source\nSELECT 1")
+    versions = iter([_status(1, 100), _status(1, 100), _status(1, 200)])
+    workspace.workspace.get_status.side_effect = lambda path: next(versions)
+
+    assert workspace_files.write_file("/Workspace/p/a.sql", "SELECT 1", language="SQL") is True
+    assert workspace_files.write_file("/Workspace/p/a.sql", "SELECT 1", language="SQL") is False
+    assert workspace_files.write_file("/Workspace/p/a.sql", "SELECT 2", language="SQL") is True
+
+    assert workspace.workspace.import_.call_count == 2
+    workspace.workspace.download.assert_not_called()
+
+
+def test_write_file_rewrites_when_remote_changed(workspace):
+    versions = iter([_status(1, 100), _status(1, 150), _status(1, 200)])
+    workspace.workspace.get_status.side_effect = lambda path: next(versions)
+
+    workspace_files.write_file("/Workspace/p/a.sql", "SELECT 1", language="SQL")
+    assert workspace_files.write_file("/Workspace/p/a.sql", "SELECT 1", language="SQL") is True
+
+    assert workspace.workspace.import_.call_count == 2